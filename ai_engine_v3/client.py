@@ -1,22 +1,79 @@
 """Thin OpenRouter/LLM client with retry & backoff"""
 from __future__ import annotations
 
-import requests, time, random, logging
+import json, requests, threading, time, random, logging
 from typing import Dict, Any, Optional
 import os
 
+try:
+    import orjson  # optional – faster request/response (de)serialisation
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for one chat completion (shared by every attempt); a dead
+# endpoint fails fast on connect instead of eating the whole read budget
+CONNECT_TIMEOUT = 5
+REQUEST_TIMEOUT = 30
+
+# One connection pool per API key for every LLMClient in the process, so the
+# relevance scorer and the processor reuse the same TLS connection to OpenRouter.
+# Keyed by key because the session carries the Authorization header.
+_session_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+
+# Rate-limit gate shared by every LLMClient in the process: the first 429 pauses
+# all callers until the window passes instead of each one rediscovering it.
+_gate_lock = threading.Lock()
+_paused_until = 0.0
+
+
+def _wait_for_gate():
+    delay = _paused_until - time.monotonic()
+    if delay > 0:
+        logger.info("OpenRouter rate limit – waiting %.1fs", delay)
+        time.sleep(delay)
+
+
+def _pause_all(seconds: float):
+    global _paused_until
+    with _gate_lock:
+        _paused_until = max(_paused_until, time.monotonic() + seconds)
+
+
+def _retry_after(response, default: float) -> float:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return default
+
+
+def _session(api_key: str) -> requests.Session:
+    with _session_lock:
+        session = _sessions.get(api_key)
+        if session is None:
+            session = requests.Session()
+            session.headers["Authorization"] = f"Bearer {api_key}"
+            # Add proper identification headers
+            session.headers["HTTP-Referer"] = "https://github.com/sonianand07/Better-French"
+            session.headers["X-Title"] = "Better French - Educational Platform"
+            session.headers["User-Agent"] = "BetterFrench/1.0"
+            session.headers["Content-Type"] = "application/json"
+            _sessions[api_key] = session
+        return session
+
+
+def _encode(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 
 class LLMClient:
     def __init__(self, model: str | None = None, api_base: str = "https://openrouter.ai/api/v1"):
         self.base = api_base
-        self.session = requests.Session()
-        self.session.headers["Authorization"] = f"Bearer {self._get_api_key()}"
-        # Add proper identification headers
-        self.session.headers["HTTP-Referer"] = "https://github.com/sonianand07/Better-French"
-        self.session.headers["X-Title"] = "Better French - Educational Platform"
-        self.session.headers["User-Agent"] = "BetterFrench/1.0"
+        self.session = _session(self._get_api_key())
 
         # Store latest token usage dict from API responses so callers can
         # estimate costs.  Structure: {"prompt_tokens": int, "completion_tokens": int, ...}
@@ -34,26 +91,33 @@ class LLMClient:
             raise RuntimeError("OPENROUTER_API_KEY env var not set")
         return key
 
-    def chat(self, messages: list[dict[str, str]], max_tokens: int = 1500, temperature: float = 0.7, retries: int = 3) -> Optional[str]:
+    def chat(self, messages: list[dict[str, str]], max_tokens: int = 1500, temperature: float = 0.7, retries: int = 3, reasoning: Optional[Dict[str, Any]] = None) -> Optional[str]:
         payload = {
             "model": self.model,
             "messages": messages,
             "max_tokens": max_tokens,
             "temperature": temperature,
         }
+        if reasoning is not None:
+            # OpenRouter's unified reasoning switch (e.g. {"enabled": False} for thinking models)
+            payload["reasoning"] = reasoning
         backoff = 2
         # Reset usage for this call
         self.last_usage: Dict[str, int] = {}
         fallback_model = "google/gemini-2.5-flash"
         switched = False  # ensure we only switch once
+        body = _encode(payload)
         for attempt in range(1, retries + 1):
+            _wait_for_gate()
+            sleep_for = backoff * (2 ** (attempt - 1)) + random.uniform(0, 1)
             try:
-                r = self.session.post(f"{self.base}/chat/completions", json=payload, timeout=30)
+                r = self.session.post(f"{self.base}/chat/completions", data=body, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT))
                 if r.status_code == 200:
-                    data = r.json()
+                    data = orjson.loads(r.content) if orjson is not None else r.json()
                     # Store token usage so the caller can estimate cost
                     self.last_usage = data.get("usage", {}) or {}
-                    return data["choices"][0]["message"]["content"].strip()
+                    # content is null when a thinking model spends the whole budget on reasoning
+                    return (data["choices"][0]["message"]["content"] or "").strip()
                 # Invalid-model guard → switch to fallback once
                 if (
                     r.status_code == 400
@@ -62,15 +126,21 @@ class LLMClient:
                     and self.model != fallback_model
                 ):
                     logger.warning("Model '%s' invalid – falling back to %s", self.model, fallback_model)
-                    self.model = fallback_model
+                    self.model = payload["model"] = fallback_model
+                    body = _encode(payload)
                     switched = True
                     continue  # retry immediately with fallback
+                if r.status_code == 429:
+                    # close the gate for everyone; the next attempt waits on it
+                    logger.warning("OpenRouter HTTP 429 – pausing LLM calls")
+                    _pause_all(_retry_after(r, sleep_for))
+                    continue
 
                 logger.warning("OpenRouter HTTP %s: %s", r.status_code, r.text[:120])
-            except requests.RequestException as e:
+            except (requests.RequestException, ValueError) as e:  # ValueError: malformed JSON body
                 logger.warning("Request error: %s", e)
-            # wait & retry
-            sleep_for = backoff * (2 ** (attempt - 1)) + random.uniform(0, 1)
-            time.sleep(sleep_for)
+            # wait & retry (no point sleeping after the last attempt)
+            if attempt < retries:
+                time.sleep(sleep_for)
         logger.error("LLM chat failed after %d attempts", retries)
         return None 
\ No newline at end of file
@@ -7,6 +7,10 @@ track whether the static site is fresh and whether the CI pipeline is healthy.
 Run locally:
     uvicorn ai_engine_v3.mcp_server.main:app --reload --port 8001
 
+uvicorn[standard] (requirements.txt) ships uvloop and httptools, and uvicorn's
+default ``--loop auto`` already runs the app on uvloop, so no loop policy is
+installed here.
+
 Env vars:
     OPENROUTER_API_KEY   – required only for /chat .
     GITHUB_TOKEN         – (optional) allows authenticated calls to GitHub REST
@@ -14,14 +18,20 @@ Env vars:
     BF_ROLLING_PATH      – (optional) path to rolling_articles.json; defaults to
                             ai_engine_v3/website/rolling_articles.json
 """
-import json, os, subprocess, datetime
+import asyncio, json, os, subprocess, datetime
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Deque
 
 import httpx
 from fastapi import FastAPI, HTTPException, Query
 from pydantic import BaseModel, Field
 
+try:
+    import orjson  # optional – faster decode of the completion body
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -37,6 +47,11 @@ GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
 OPENROUTER_BASE = "https://openrouter.ai/api/v1"
 CHAT_MODEL = "mistralai/mistral-medium-3"
+CHAT_HEADERS = {"Authorization": f"Bearer {OPENROUTER_API_KEY}"}
+
+# Shared timeout objects – built once instead of per request
+GITHUB_TIMEOUT = httpx.Timeout(20.0)
+CHAT_TIMEOUT = httpx.Timeout(30.0)
 
 # ---------------------------------------------------------------------------
 # Util helpers
@@ -52,10 +67,11 @@ def git_pull_fast() -> None:
 
 def load_articles() -> List[Dict[str, Any]]:
     """Return list of article dicts or empty list."""
-    if not ROLLING_JSON_PATH.exists():
+    try:
+        with ROLLING_JSON_PATH.open("r", encoding="utf-8") as fp:
+            data = json.load(fp)
+    except FileNotFoundError:
         return []
-    with ROLLING_JSON_PATH.open("r", encoding="utf-8") as fp:
-        data = json.load(fp)
     if isinstance(data, dict):
         return data.get("articles", [])
     if isinstance(data, list):
@@ -63,6 +79,12 @@ def load_articles() -> List[Dict[str, Any]]:
     return []
 
 
+def pull_and_load_articles() -> List[Dict[str, Any]]:
+    """git pull then load – one worker-thread hop for endpoints that need both."""
+    git_pull_fast()
+    return load_articles()
+
+
 def latest_processed_at(articles: List[Dict[str, Any]]) -> str | None:
     dates = [a.get("processed_at") or a.get("original_article_published_date") for a in articles if a]
     return max(dates) if dates else None
@@ -76,7 +98,7 @@ async def fetch_last_workflow_run() -> Dict[str, Any] | None:
     headers = {"Accept": "application/vnd.github+json"}
     if GITHUB_TOKEN:
         headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
-    async with httpx.AsyncClient(timeout=20) as client:
+    async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
         try:
             resp = await client.get(url, headers=headers)
             resp.raise_for_status()
@@ -105,8 +127,8 @@ app = FastAPI(title="Better French MCP", version="0.2.0")
 @app.get("/status")
 async def status():
     """Return basic site stats (count, newest article time)."""
-    git_pull_fast()
-    arts = load_articles()
+    # git pull + JSON parse are blocking – keep them off the event loop
+    arts = await asyncio.to_thread(pull_and_load_articles)
     return {
         "live_articles": len(arts),
         "updated_at": latest_processed_at(arts),
@@ -116,8 +138,7 @@ async def status():
 @app.get("/articles")
 async def articles(limit: int = Query(20, ge=1, le=100)):
     """Return the N most recent articles (for quick QA)."""
-    git_pull_fast()
-    arts = load_articles()[:limit]
+    arts = (await asyncio.to_thread(pull_and_load_articles))[:limit]
     return arts
 
 @app.get("/ci")
@@ -137,7 +158,7 @@ async def ci():
 @app.get("/freshness")
 async def freshness():
     """Compare site updated_at vs last successful CI finish time."""
-    arts = load_articles()
+    arts = await asyncio.to_thread(load_articles)
     site_time_str = latest_processed_at(arts)
     run = await fetch_last_workflow_run()
     ci_time_str = run.get("updated_at") if run else None
@@ -157,31 +178,30 @@ async def freshness():
 # Simple chat passthrough (optional)
 # ---------------------------------------------------------------------------
 
-chat_history: Dict[str, List[Dict[str, str]]] = {}
 HIST = 10
+# Per-user ring buffer – old turns fall off automatically
+chat_history: Dict[str, Deque[Dict[str, str]]] = {}
 
 @app.post("/chat", response_model=ChatResponse)
 async def chat(req: ChatRequest):
     if not OPENROUTER_API_KEY:
         raise HTTPException(status_code=400, detail="OPENROUTER_API_KEY not set on server")
-    hist = chat_history.get(req.user_id, [])[-HIST:]
-    msgs = hist + [{"role": "user", "content": req.message}]
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-    }
+    msgs = [*chat_history.get(req.user_id, ()), {"role": "user", "content": req.message}]
     payload = {"model": CHAT_MODEL, "messages": msgs, "max_tokens": 700, "temperature": 0.7}
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with httpx.AsyncClient(timeout=CHAT_TIMEOUT) as client:
         try:
-            r = await client.post(f"{OPENROUTER_BASE}/chat/completions", json=payload, headers=headers)
+            r = await client.post(f"{OPENROUTER_BASE}/chat/completions", json=payload, headers=CHAT_HEADERS)
             r.raise_for_status()
         except httpx.HTTPError as exc:
             raise HTTPException(status_code=502, detail=f"OpenRouter error: {exc}")
-    data = r.json()
+    data = orjson.loads(r.content) if orjson is not None else r.json()
     reply = data["choices"][0]["message"]["content"].strip()
     usage = data.get("usage", {})
     # cost estimate (mistral-medium)
     cost = (usage.get("prompt_tokens", 0)/1000)*0.0004 + (usage.get("completion_tokens", 0)/1000)*0.002
-    chat_history.setdefault(req.user_id, []).extend([
+    if req.user_id not in chat_history:
+        chat_history[req.user_id] = deque(maxlen=HIST)
+    chat_history[req.user_id].extend([
         {"role": "user", "content": req.message},
         {"role": "assistant", "content": reply},
     ])
@@ -5,13 +5,16 @@ Usage:
     python -m ai_engine_v2.personaliser --profile profiles/u123.json --top 25
     python -m ai_engine_v2.personaliser --all-profiles profiles/*.json --top 20
 """
-import argparse, glob, json, pathlib, logging
+import argparse, glob, heapq, json, pathlib, logging
 from typing import List, Dict
 
 from .profile import UserProfile
 from .pipeline.config import HIGH_RELEVANCE_KEYWORDS, MEDIUM_RELEVANCE_KEYWORDS
+from .pipeline.utils import fold_text
 
 ROLLING_PATH = pathlib.Path(__file__).resolve().parent / "website" / "rolling_articles.json"
+PERSONAL_DIR = ROLLING_PATH.parent / "personalised"
+PERSONAL_DIR.mkdir(parents=True, exist_ok=True)
 logger = logging.getLogger(__name__)
 
 
@@ -24,12 +27,12 @@ def load_articles() -> List[Dict]:
 
 
 def score(article: Dict, profile: UserProfile) -> float:
-    txt = f"{article.get('title', '')} {article.get('summary', '')}".lower()
+    txt = fold_text(f"{article.get('title', '')} {article.get('summary', '')}")
     score = 0.0
-    for kw in profile.work_domains + profile.pain_points + profile.interests:
-        if kw.lower() in txt:
+    for kw in profile.keywords:
+        if kw in txt:
             score += 3
-    if profile.lives_in and profile.lives_in.lower() in txt:
+    if profile.lives_in and fold_text(profile.lives_in) in txt:
         score += 2
     return score
 
@@ -37,11 +40,8 @@ def score(article: Dict, profile: UserProfile) -> float:
 def personalise(profile_path: pathlib.Path, top: int):
     profile = UserProfile.load(profile_path)
     arts = load_articles()
-    ranked = sorted(arts, key=lambda a: score(a, profile), reverse=True)
-    out = ranked[:top]
-    out_dir = ROLLING_PATH.parent / "personalised"
-    out_dir.mkdir(exist_ok=True)
-    out_file = out_dir / f"personal_{profile.user_id}.json"
+    out = heapq.nlargest(top, arts, key=lambda a: score(a, profile))
+    out_file = PERSONAL_DIR / f"personal_{profile.user_id}.json"
     out_file.write_text(json.dumps(out, ensure_ascii=False, indent=2))
     logger.info("Personalised feed for %s → %s (%d articles)", profile.user_id, out_file, len(out))
 
@@ -11,18 +11,110 @@ import json
 import re
 import uuid
 import logging
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields, is_dataclass
 from difflib import SequenceMatcher
 
+import numpy as np
+
 # Add config directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
 from automation import AUTOMATION_CONFIG
 
+try:
+    import ahocorasick  # optional – one automaton walk instead of a scan per keyword list
+except ModuleNotFoundError:  # pragma: no cover
+    ahocorasick = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Column order of _score_matrix()
+SCORE_COLUMNS = ('quality', 'relevance', 'importance', 'total')
+
+# Importance keyword lists (EXACT same as manual system)
+POLICY_KEYWORDS = (
+    'gouvernement', 'ministre', 'président', 'assemblée', 'sénat',
+    'loi', 'décret', 'réforme', 'politique', 'décision officielle'
+)
+ECONOMIC_KEYWORDS = (
+    'économie', 'emploi', 'chômage', 'inflation', 'prix', 'salaire',
+    'impôt', 'budget', 'crise', 'marché', 'entreprise'
+)
+SOCIAL_KEYWORDS = (
+    'société', 'social', 'manifestation', 'grève', 'éducation',
+    'santé', 'logement', 'transport', 'sécurité', 'justice'
+)
+LOCAL_INDICATORS = ('commune', 'village', 'petit', 'local')
+MAJOR_CITIES = ('paris', 'lyon', 'marseille', 'toulouse', 'nice', 'nantes')
+
+# Relevance context lists (EXACT same as manual system)
+INTERNATIONAL_INDICATORS = ('états-unis', 'chine', 'russie', 'ukraine', 'gaza')
+FRANCE_CONTEXT = ('france', 'français', 'hexagone', 'paris', 'gouvernement')
+
+# French structure markers (articles, common verbs, prepositions) as one alternation:
+# a single scan reports which groups occur instead of one search per group
+_FRENCH_MARKERS_RE = re.compile(
+    r'\b(?:(?P<article>le|la|les|un|une|des)'
+    r'|(?P<verb>est|sont|était|sera)'
+    r'|(?P<preposition>avec|dans|pour|sur|par))\b'
+)
+_FRENCH_MARKER_GROUPS = len(_FRENCH_MARKERS_RE.groupindex)
+
+
+def _french_marker_count(text: str) -> int:
+    """Number of marker groups (0-3) present in text; stops once all are seen"""
+    seen = set()
+    for match in _FRENCH_MARKERS_RE.finditer(text):
+        seen.add(match.lastgroup)
+        if len(seen) == _FRENCH_MARKER_GROUPS:
+            break
+    return len(seen)
+
+
+def _build_keyword_automaton(keyword_map: Dict[str, Any]):
+    """One automaton over every list in keyword_map; a keyword may sit in several categories"""
+    categories: Dict[str, set] = {}
+    for category, keywords in keyword_map.items():
+        for keyword in keywords:
+            categories.setdefault(keyword, set()).add(category)
+    automaton = ahocorasick.Automaton()
+    for keyword, cats in categories.items():
+        automaton.add_word(keyword, (keyword, frozenset(cats)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_hits(automaton, keyword_map: Dict[str, Any], text: str) -> Dict[str, set]:
+    """Category -> distinct keywords of that category found in text"""
+    hits: Dict[str, set] = {}
+    if automaton is not None:
+        for _end, (keyword, cats) in automaton.iter(text):
+            for category in cats:
+                hits.setdefault(category, set()).add(keyword)
+        return hits
+    for category, keywords in keyword_map.items():
+        found = {keyword for keyword in keywords if keyword in text}
+        if found:
+            hits[category] = found
+    return hits
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Dataclass field names, resolved once per class instead of per article"""
+    return tuple(f.name for f in fields(cls))
+
+def _article_dict(article: Any) -> Dict[str, Any]:
+    """Field dict for a scraper article (dicts pass through; slotted dataclasses have no __dict__)"""
+    if isinstance(article, dict):
+        return article
+    if is_dataclass(article):
+        return {name: getattr(article, name) for name in _field_names(type(article))}
+    return article.__dict__
+
 @dataclass
 class ScoredArticle:
     """Article with quality scores (matches manual system structure)"""
@@ -44,6 +136,14 @@ class ScoredArticle:
     fast_tracked: bool = False
     urgency_score: float = 0.0
 
+def _score_matrix(articles) -> np.ndarray:
+    """(n, 4) array of quality/relevance/importance/total scores, read in one pass"""
+    return np.fromiter(
+        ((a.quality_score, a.relevance_score, a.importance_score, a.total_score) for a in articles),
+        dtype=(np.float64, len(SCORE_COLUMNS)),
+        count=len(articles),
+    )
+
 class AutomatedCurator:
     """
     Automated quality curator with EXACT same scoring logic as manual system
@@ -129,6 +229,28 @@ class AutomatedCurator:
             'context': ['contexte', 'histoire', 'background', 'explication', 'pourquoi']
         }
         
+        # Importance categories matched against the article text (a keyword may sit in several)
+        self.importance_keywords = {
+            'urgent': self.high_importance_indicators,
+            'policy': POLICY_KEYWORDS,
+            'economic': ECONOMIC_KEYWORDS,
+            'social': SOCIAL_KEYWORDS,
+            'local': LOCAL_INDICATORS,
+            'major_city': MAJOR_CITIES,
+        }
+        self.relevance_keywords = {
+            'high': self.high_relevance_keywords,
+            'medium': self.medium_relevance_keywords,
+            'low': self.low_relevance_keywords,
+            'international': INTERNATIONAL_INDICATORS,
+            'france_context': FRANCE_CONTEXT,
+        }
+        self._importance_automaton = None
+        self._relevance_automaton = None
+        if ahocorasick is not None:
+            self._importance_automaton = _build_keyword_automaton(self.importance_keywords)
+            self._relevance_automaton = _build_keyword_automaton(self.relevance_keywords)
+        
         # Quality thresholds from config
         self.quality_config = AUTOMATION_CONFIG['quality']
         
@@ -171,12 +293,7 @@ class AutomatedCurator:
         
         # 4. Language quality (+1)
         # Check for proper French structure
-        french_patterns = [
-            r'\b(le|la|les|un|une|des)\b',  # Articles
-            r'\b(est|sont|était|sera)\b',   # Common verbs
-            r'\b(avec|dans|pour|sur|par)\b'  # Prepositions
-        ]
-        french_score = sum(1 for pattern in french_patterns if re.search(pattern, full_text))
+        french_score = _french_marker_count(full_text)
         score += min(1.0, french_score * 0.2)
         
         # Quality penalties
@@ -207,14 +324,14 @@ class AutomatedCurator:
         
         full_text = f"{title} {summary} {content} {category}"
         
+        hits = _keyword_hits(self._relevance_automaton, self.relevance_keywords, full_text)
+        
         # High relevance for expat life (+4)
-        high_matches = sum(1 for keyword in self.high_relevance_keywords 
-                          if keyword in full_text)
+        high_matches = len(hits.get('high', ()))
         score += min(4.0, high_matches * 0.8)
         
         # Medium relevance for French society (+2)
-        medium_matches = sum(1 for keyword in self.medium_relevance_keywords 
-                           if keyword in full_text)
+        medium_matches = len(hits.get('medium', ()))
         score += min(2.0, medium_matches * 0.3)
         
         # Category-based relevance (+1)
@@ -226,16 +343,11 @@ class AutomatedCurator:
             score += 1.0
         
         # Penalties for low relevance (-3)
-        low_matches = sum(1 for keyword in self.low_relevance_keywords 
-                         if keyword in full_text)
+        low_matches = len(hits.get('low', ()))
         score -= min(3.0, low_matches * 1.0)
         
         # International news penalty (unless affects France) (-1)
-        international_indicators = ['états-unis', 'chine', 'russie', 'ukraine', 'gaza']
-        france_context = ['france', 'français', 'hexagone', 'paris', 'gouvernement']
-        
-        if (any(indicator in full_text for indicator in international_indicators) and
-            not any(context in full_text for context in france_context)):
+        if 'international' in hits and 'france_context' not in hits:
             score -= 1.0
         
         return max(0, min(10, score))
@@ -251,32 +363,22 @@ class AutomatedCurator:
         
         full_text = f"{title} {summary} {content}"
         
+        found = self.importance_categories(full_text)
+        
         # Breaking news/urgent (+2)
-        if any(indicator in full_text for indicator in self.high_importance_indicators):
+        if 'urgent' in found:
             score += 2.0
         
         # Government/policy news (+2)
-        policy_keywords = [
-            'gouvernement', 'ministre', 'président', 'assemblée', 'sénat',
-            'loi', 'décret', 'réforme', 'politique', 'décision officielle'
-        ]
-        if any(keyword in full_text for keyword in policy_keywords):
+        if 'policy' in found:
             score += 2.0
         
         # Economic impact (+1.5)
-        economic_keywords = [
-            'économie', 'emploi', 'chômage', 'inflation', 'prix', 'salaire',
-            'impôt', 'budget', 'crise', 'marché', 'entreprise'
-        ]
-        if any(keyword in full_text for keyword in economic_keywords):
+        if 'economic' in found:
             score += 1.5
         
         # Social impact (+1.5)
-        social_keywords = [
-            'société', 'social', 'manifestation', 'grève', 'éducation',
-            'santé', 'logement', 'transport', 'sécurité', 'justice'
-        ]
-        if any(keyword in full_text for keyword in social_keywords):
+        if 'social' in found:
             score += 1.5
         
         # Source reputation (+1)
@@ -288,15 +390,15 @@ class AutomatedCurator:
             score += 1.0
         
         # Local/regional penalty (unless major city) (-1)
-        local_indicators = ['commune', 'village', 'petit', 'local']
-        major_cities = ['paris', 'lyon', 'marseille', 'toulouse', 'nice', 'nantes']
-        
-        if (any(indicator in full_text for indicator in local_indicators) and
-            not any(city in full_text for city in major_cities)):
+        if 'local' in found and 'major_city' not in found:
             score -= 1.0
         
         return max(0, min(10, score))
     
+    def importance_categories(self, full_text: str) -> set:
+        """Names of the importance categories with at least one keyword in the text"""
+        return set(_keyword_hits(self._importance_automaton, self.importance_keywords, full_text))
+    
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts (0-1) - same as manual system"""
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
@@ -353,10 +455,7 @@ class AutomatedCurator:
     def score_single_article(self, article: Dict[str, Any]) -> ScoredArticle:
         """Score a single article with all three metrics"""
         # Convert from smart scraper format if needed
-        if hasattr(article, '__dict__'):
-            article_data = article.__dict__
-        else:
-            article_data = article
+        article_data = _article_dict(article)
         
         quality = self.score_quality(article_data)
         relevance = self.score_relevance(article_data)
@@ -393,7 +492,7 @@ class AutomatedCurator:
             if (scored_article.total_score >= min_score or 
                 scored_article.urgency_score >= 3.0):
                 curated.append(scored_article)
-                logger.debug(f"✅ Fast-tracked: {scored_article.original_data.get('title', '')[:50]}...")
+                logger.debug("✅ Fast-tracked: %.50s...", scored_article.original_data.get('title', ''))
             else:
                 scored_article.rejection_reason = f"low_score_breaking_{scored_article.total_score:.1f}"
         
@@ -407,10 +506,7 @@ class AutomatedCurator:
         # Convert articles to dict format if needed
         article_dicts = []
         for article in articles:
-            if hasattr(article, '__dict__'):
-                article_dicts.append(article.__dict__)
-            else:
-                article_dicts.append(article)
+            article_dicts.append(_article_dict(article))
         
         # Score all articles
         scored_articles = []
@@ -473,20 +569,12 @@ class AutomatedCurator:
         
         # Calculate statistics
         if self.curated_articles:
-            scores = {
-                'quality': [a.quality_score for a in self.curated_articles],
-                'relevance': [a.relevance_score for a in self.curated_articles],
-                'importance': [a.importance_score for a in self.curated_articles],
-                'total': [a.total_score for a in self.curated_articles]
+            matrix = _score_matrix(self.curated_articles)
+            mins, maxs, avgs = matrix.min(axis=0), matrix.max(axis=0), matrix.mean(axis=0)
+            stats = {
+                score_type: {'min': float(mins[i]), 'max': float(maxs[i]), 'avg': float(avgs[i])}
+                for i, score_type in enumerate(SCORE_COLUMNS)
             }
-            
-            stats = {}
-            for score_type, values in scores.items():
-                stats[score_type] = {
-                    'min': min(values),
-                    'max': max(values),
-                    'avg': sum(values) / len(values)
-                }
         else:
             stats = {}
         
@@ -497,7 +585,7 @@ class AutomatedCurator:
                 "curator_version": "Automated Curator 1.0",
                 "automation_system": "Better French Max Automated System",
                 "quality_threshold": self.quality_config['min_total_score'],
-                "fast_tracked_articles": len([a for a in self.curated_articles if a.fast_tracked]),
+                "fast_tracked_articles": sum(1 for a in self.curated_articles if a.fast_tracked),
                 "statistics": stats,
                 "scoring_system": {
                     "quality": "0-10 based on content completeness, writing quality, structure",
@@ -525,10 +613,7 @@ class AutomatedCurator:
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
         # Group rejections by reason
-        rejection_reasons = {}
-        for article in self.rejected_articles:
-            reason = article.rejection_reason
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
+        rejection_reasons = dict(Counter(article.rejection_reason for article in self.rejected_articles))
         
         data = {
             "metadata": {
@@ -551,21 +636,20 @@ class AutomatedCurator:
         if not self.curated_articles:
             return {"status": "no_articles"}
         
-        scores = [a.total_score for a in self.curated_articles]
-        quality_scores = [a.quality_score for a in self.curated_articles]
-        relevance_scores = [a.relevance_score for a in self.curated_articles]
-        importance_scores = [a.importance_score for a in self.curated_articles]
+        matrix = _score_matrix(self.curated_articles)
+        avg_quality, avg_relevance, avg_importance, avg_total = matrix.mean(axis=0).tolist()
+        totals = matrix[:, SCORE_COLUMNS.index('total')]
         
         return {
             "status": "active",
             "total_articles": len(self.curated_articles),
-            "average_total_score": sum(scores) / len(scores),
-            "average_quality": sum(quality_scores) / len(quality_scores),
-            "average_relevance": sum(relevance_scores) / len(relevance_scores),
-            "average_importance": sum(importance_scores) / len(importance_scores),
-            "min_score": min(scores),
-            "max_score": max(scores),
-            "fast_tracked_count": len([a for a in self.curated_articles if a.fast_tracked]),
+            "average_total_score": avg_total,
+            "average_quality": avg_quality,
+            "average_relevance": avg_relevance,
+            "average_importance": avg_importance,
+            "min_score": float(totals.min()),
+            "max_score": float(totals.max()),
+            "fast_tracked_count": sum(1 for a in self.curated_articles if a.fast_tracked),
             "threshold_used": self.quality_config['min_total_score']
         }
 
@@ -1,35 +1,63 @@
 from __future__ import annotations
 """Curator v2 – filters & scores articles for expat professionals in France."""
-import re, logging
+import os, re, sys, heapq, logging
+from operator import attrgetter
 from typing import List, Any
 
 import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 
 from .config import HIGH_RELEVANCE_KEYWORDS, MEDIUM_RELEVANCE_KEYWORDS, CURATOR_WEIGHTS
-from .scraper import NewsArticle
+from .scraper import NewsArticle, article_to_dict
+from .utils import fold_text
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick  # optional – single automaton walk instead of N substring scans
+except ModuleNotFoundError:  # pragma: no cover
+    ahocorasick = None
+
+# Keyword banks folded (accents stripped, lower-cased) and interned once at import
+_HIGH_KW = frozenset(sys.intern(fold_text(k)) for k in HIGH_RELEVANCE_KEYWORDS)
+_MEDIUM_KW = frozenset(sys.intern(fold_text(k)) for k in MEDIUM_RELEVANCE_KEYWORDS)
+
+# Relevance bucket -> score; a lower bucket wins when several match
+_BUCKET_SCORES = (9.0, 7.0, 6.0)
+
+# Entity label -> practical-impact points, counted once per label present
+_ENTITY_POINTS = {"MONEY": 3, "DATE": 2, "PERCENT": 1, "ORG": 1}
+
+_W_RELEVANCE = CURATOR_WEIGHTS["relevance"]
+_W_PRACTICAL = CURATOR_WEIGHTS["practical"]
+_W_NEWSWORTHINESS = CURATOR_WEIGHTS["newsworthiness"]
+_MIN_TOTAL_SCORE = 10  # tuned empirically
+
+
+def _total_score(relevance: float, practical: float, newsworthiness: float) -> float:
+    return relevance * _W_RELEVANCE + practical * _W_PRACTICAL + newsworthiness * _W_NEWSWORTHINESS
+
 try:
     _NLP: Language = spacy.load("fr_core_news_sm")
 except Exception:
     _NLP = spacy.blank("fr")
 
+# BF_SPACY_PROCS>1 spreads NER over worker processes (worth it for large scrapes
+# on multi-core runners; the blank fallback model has nothing to parallelise)
+_NLP_PROCS = int(os.getenv("BF_SPACY_PROCS", "1"))
+_MIN_DOCS_PER_PROC = 100
+
 
 class ScoredArticleV2:
     def __init__(self, original: NewsArticle, relevance: float, practical: float, newsworthiness: float):
-        self.original_data = original.__dict__
+        self.original_data = article_to_dict(original)
         self.relevance_score = relevance
         self.practical_score = practical
         self.newsworthiness_score = newsworthiness
         # Alias for compatibility with QualityScores model
         self.importance_score = newsworthiness
-        self.total_score = (
-            relevance * CURATOR_WEIGHTS["relevance"]
-            + practical * CURATOR_WEIGHTS["practical"]
-            + newsworthiness * CURATOR_WEIGHTS["newsworthiness"]
-        )
+        self.total_score = _total_score(relevance, practical, newsworthiness)
         # Rescale to 0-10 for QualityScores model (max theoretical 30)
         self.quality_score = round(min(self.total_score / 3, 10.0), 3)
 
@@ -40,42 +68,70 @@ class CuratorV2:
     def __init__(self, profile: 'UserProfile | None' = None):
         from ..profile import UserProfile  # local import to avoid cycle
         self.profile = profile
-        self.high_kw = set(HIGH_RELEVANCE_KEYWORDS)
-        self.medium_kw = set(MEDIUM_RELEVANCE_KEYWORDS)
-        self.profile_kw = set()
-        if profile:
-            self.profile_kw.update({w.lower() for w in profile.work_domains})
-            self.profile_kw.update({w.lower() for w in profile.pain_points})
-            self.profile_kw.update({w.lower() for w in profile.interests})
+        # Article text is folded once per score to match the pre-folded keyword banks
+        self.high_kw = _HIGH_KW
+        self.medium_kw = _MEDIUM_KW
+        self.profile_kw = frozenset(profile.keywords) if profile else frozenset()
+        self._automaton = self._build_automaton() if ahocorasick is not None else None
+        self._scan_relevance = self._build_scanner()
+
+    def _build_automaton(self):
+        automaton = ahocorasick.Automaton()
+        # medium keywords share the 7.0 bucket with the France-wide catch-all
+        buckets = (self.high_kw, self.medium_kw | {"france", "francais"}, self.profile_kw)
+        for bucket, words in enumerate(buckets):
+            for word in words:
+                if word and word not in automaton:
+                    automaton.add_word(word, bucket)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_scanner(self):
+        """Return ``folded text -> relevance`` with the keyword banks bound as closure cells.
+
+        The banks never change after ``__init__``, so the per-article call skips
+        the attribute lookups on ``self``.
+        """
+        if self._automaton is not None:
+            iter_matches = self._automaton.iter
+            bucket_scores = _BUCKET_SCORES
+
+            def scan(txt: str) -> float:
+                best = None
+                for _end, bucket in iter_matches(txt):
+                    if bucket == 0:
+                        return 9.0
+                    if best is None or bucket < best:
+                        best = bucket
+                return bucket_scores[best] if best is not None else 4.0
+
+            return scan
+
+        high_kw, medium_kw, profile_kw = self.high_kw, self.medium_kw, self.profile_kw
+
+        def scan(txt: str) -> float:
+            if any(kw in txt for kw in high_kw):
+                return 9.0
+            if any(kw in txt for kw in medium_kw):
+                return 7.0
+            # France-wide catch-all so big national topics aren't missed
+            if "france" in txt or "francais" in txt:
+                return 7.0
+            if profile_kw and any(kw in txt for kw in profile_kw):
+                return 6.0
+            return 4.0
+
+        return scan
 
     # ----------------------------------------------------- scoring helpers
     def _score_relevance(self, text: str, is_global: bool = False) -> float:
-        txt = text.lower()
         if is_global:
             return 8.0
-        if any(kw in txt for kw in self.high_kw):
-            return 9.0
-        if any(kw in txt for kw in self.medium_kw):
-            return 7.0
-        # France-wide catch-all so big national topics aren't missed
-        if "france" in txt or "français" in txt:
-            return 7.0
-        if self.profile_kw and any(kw in txt for kw in self.profile_kw):
-            return 6.0
-        return 4.0
-
-    def _score_practical(self, text: str) -> float:
-        doc = _NLP(text)
-        ent_types = {ent.label_ for ent in doc.ents}
-        score = 0
-        if "MONEY" in ent_types:
-            score += 3
-        if "DATE" in ent_types:
-            score += 2
-        if "PERCENT" in ent_types:
-            score += 1
-        if "ORG" in ent_types:
-            score += 1
+        return self._scan_relevance(fold_text(text))
+
+    def _score_practical(self, doc: Doc) -> float:
+        points = _ENTITY_POINTS
+        score = sum(points.get(label, 0) for label in {ent.label_ for ent in doc.ents})
         return min(score, 9)
 
     def _score_newsworthiness(self, art: NewsArticle) -> float:
@@ -85,23 +141,29 @@ class CuratorV2:
 
     # ----------------------------------------------------- public API
     def curate(self, raw_articles: List[NewsArticle]) -> List[ScoredArticleV2]:
-        scored: List[ScoredArticleV2] = []
-        for art in raw_articles:
+        approved: List[ScoredArticleV2] = []
+        # One batched spaCy pass over the whole scrape instead of a pipeline call per article
+        n_process = 1
+        if _NLP_PROCS > 1 and "ner" in _NLP.pipe_names:
+            n_process = max(1, min(_NLP_PROCS, len(raw_articles) // _MIN_DOCS_PER_PROC))
+        docs = _NLP.pipe(
+            (art.summary or art.title for art in raw_articles), batch_size=64, n_process=n_process
+        )
+        for art, doc in zip(raw_articles, docs):
             rel = self._score_relevance(art.title + " " + art.summary, art.global_event)
-            prac = self._score_practical(art.summary or art.title)
+            prac = self._score_practical(doc)
             news = self._score_newsworthiness(art)
-            scored.append(ScoredArticleV2(art, rel, prac, news))
+            # Only articles that clear the threshold get a ScoredArticleV2
+            if _total_score(rel, prac, news) >= _MIN_TOTAL_SCORE:
+                approved.append(ScoredArticleV2(art, rel, prac, news))
 
-        # Filter by total threshold 10 – tuned empirically
-        approved = [a for a in scored if a.total_score >= 10]
-        logger.info("CuratorV2 approved %d/%d articles", len(approved), len(scored))
+        logger.info("CuratorV2 approved %d/%d articles", len(approved), len(raw_articles))
 
         # Cap global-event items to 5 to avoid overload
         globals_only = [a for a in approved if a.original_data.get("global_event") or getattr(a.original_data, 'global_event', False)]
         if len(globals_only) > 5:
-            # sort globals by total_score and keep top 5
-            globals_only.sort(key=lambda x: x.total_score, reverse=True)
-            globals_top = globals_only[:5]
+            # keep the top 5 globals by total_score
+            globals_top = heapq.nlargest(5, globals_only, key=attrgetter("total_score"))
             # keep all non-global approved items
             non_globals = [a for a in approved if a not in globals_only]
             approved = globals_top + non_globals
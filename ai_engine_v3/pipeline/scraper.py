@@ -8,21 +8,22 @@ Builds on proven manual system sources and logic
 import os
 import sys
 import time
+import heapq
 import feedparser
 import requests
 import json
-import hashlib
 import logging
 from datetime import datetime, timezone, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
 import re
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from typing import List, Dict, Optional, Any, Set, Tuple
 from dateutil import parser as date_parser
 import threading
 from pathlib import Path
 from difflib import SequenceMatcher
+from collections import Counter
 
 # Attempt to load legacy config; otherwise use local fallback values.
 try:
@@ -53,13 +54,57 @@ except ModuleNotFoundError:
     ]}
 
 # v2 helpers
-from .utils import DedupStore, FeedCache
+from .utils import DedupStore, fast_digest
+from .rss_fast import parse_rss_stream
 from langdetect import detect, LangDetectException
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# EXACT same feed URLs as proven manual system – shared read-only by every scraper
+FEED_URLS = {
+    # Major French Newspapers
+    "Le Monde": "http://www.lemonde.fr/rss/une.xml",
+    "Le Figaro": "http://www.lefigaro.fr/rss/figaro_actualites.xml",
+    "Liberation": "https://www.liberation.fr/rss/",
+    "Le Parisien": "https://feeds.leparisien.fr/leparisien/rss",
+    "L'Express": "https://www.lexpress.fr/arc/outboundfeeds/rss/alaune.xml",
+    "Le Point": "http://www.lepoint.fr/rss.xml",
+    "L'Obs": "http://tempsreel.nouvelobs.com/rss.xml",
+    "La Croix": "https://www.la-croix.com/RSS",
+
+    # TV/Radio News
+    "BFM TV": "https://www.bfmtv.com/rss/news-24-7/",
+    "France Info": "https://www.francetvinfo.fr/titres.rss",
+    "France Inter": "https://www.franceinter.fr/rss",
+    "Europe 1": "https://www.europe1.fr/rss.xml",
+    "France 24": "https://www.france24.com/fr/rss",
+    "RFI": "https://rfi.fr/fr/rss",
+
+    # Regional/Specialized
+    "Ouest France": "https://www.ouest-france.fr/rss/une",
+    "20 Minutes": "https://partner-feeds.20min.ch/rss/20minutes",
+    "AFP": "https://www.afp.com/fr/actus/afp_actualite/792,31,9,7,33/feed",
+
+    # Alternative/Independent
+    "Mediapart": "https://www.mediapart.fr/articles/feed",
+    "Brief.me": "https://brief.me/rss",
+
+    # Categories from Le Monde
+    "Le Monde Politique": "https://www.lemonde.fr/politique/rss_full.xml",
+    "Le Monde International": "https://www.lemonde.fr/international/rss_full.xml",
+    "Le Monde Economie": "https://www.lemonde.fr/economie/rss_full.xml",
+    "Le Monde Culture": "https://www.lemonde.fr/culture/rss_full.xml",
+    "Le Monde Sport": "https://www.lemonde.fr/sport/rss_full.xml",
+    "Le Monde Sciences": "https://www.lemonde.fr/sciences/rss_full.xml",
+}
+
+_FEED_HOSTS = frozenset(urlparse(url).netloc for url in FEED_URLS.values())
+
+# Read size when streaming feed bodies into the parser
+FEED_CHUNK_SIZE = 16384
+
+@dataclass(slots=True)
 class ArticleMetadata:
     """Metadata for tracking article processing history"""
     first_seen: str
@@ -69,7 +114,7 @@ class ArticleMetadata:
     quality_score: float = 0.0
     duplicate_of: Optional[str] = None  # Article hash if this is a duplicate
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """Data structure for a news article with enhanced tracking"""
     # Basic article info
@@ -113,6 +158,43 @@ class NewsArticle:
     # New flag – marked later if the same story appears across many sources
     global_event: bool = False
 
+_ARTICLE_FIELDS = tuple(f.name for f in fields(NewsArticle))
+
+
+def article_to_dict(article: NewsArticle) -> Dict[str, Any]:
+    """Shallow field dict for an article (NewsArticle uses __slots__, so has no __dict__)"""
+    return {name: getattr(article, name) for name in _ARTICLE_FIELDS}
+
+
+def article_to_record(article: NewsArticle) -> Dict[str, Any]:
+    """JSON-ready dict for an article, without ``asdict``'s recursive deep copy.
+
+    Only the mutable fields (``tags`` and ``metadata``) are copied, so the record
+    is a snapshot that later changes to the article cannot reach.
+    """
+    record = article_to_dict(article)
+    record["tags"] = list(article.tags)
+    if article.metadata is not None:
+        record["metadata"] = asdict(article.metadata)
+    return record
+
+def _urgency_weight(keyword: str) -> float:
+    """Urgency contribution of one breaking-news keyword"""
+    if keyword in ['breaking', 'urgent', 'alerte', 'exclusif']:
+        return 3.0  # High urgency
+    if keyword in ['dernière minute', 'état d\'urgence']:
+        return 2.5  # Very high urgency
+    if keyword in ['gouvernement', 'président', 'crise']:
+        return 2.0  # High importance
+    return 1.0  # Medium importance
+
+# Time-sensitive language (matched against lowercased text)
+_URGENT_PATTERNS = [
+    re.compile(r'\b(?:maintenant|immédiatement|urgent|breaking)\b'),
+    re.compile(r'\b(?:en cours|actuellement|ce matin)\b'),
+    re.compile(r'\b(?:annonce|révèle|confirme)\b'),
+]
+
 class EnhancedDeduplicator:
     """Advanced deduplication system for articles"""
     
@@ -121,7 +203,16 @@ class EnhancedDeduplicator:
         self.article_cache = {}  # hash -> ArticleMetadata
         self.processed_articles = set()  # Track what's been processed
         self.similarity_cache = {}  # Cache similarity calculations
+        self.title_index = {}  # (source, normalised title) -> content hash
         self.cache_lock = threading.Lock()
+        # source -> priority, resolved once instead of scanning both config lists per article
+        self.source_priorities = dict.fromkeys(scraping_config['breaking_news_priority_sources'], 8)
+        self.source_priorities.update(dict.fromkeys(scraping_config['high_reliability_sources'], 10))
+        
+    @staticmethod
+    def _title_key(title: str) -> str:
+        """Normalise a title for exact-match lookups"""
+        return ' '.join(re.sub(r'[^\w\s]', '', title.lower()).split())
         
     def create_content_hash(self, title: str, summary: str, content: str = "") -> str:
         """Create a hash for content-based deduplication"""
@@ -130,7 +221,7 @@ class EnhancedDeduplicator:
         normalized = re.sub(r'[^\w\s]', '', normalized)
         normalized = ' '.join(normalized.split())
         
-        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+        return fast_digest(normalized)
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
@@ -160,25 +251,16 @@ class EnhancedDeduplicator:
                 if article.content_hash in self.article_cache:
                     return True, article.content_hash
             
-            # Check title and content similarity
-            title_threshold = self.config['title_similarity_threshold']
-            content_threshold = self.config['similarity_threshold']
-            
-            for cached_hash, metadata in self.article_cache.items():
-                # Skip old articles
-                first_seen = datetime.fromisoformat(metadata.first_seen.replace('Z', '+00:00'))
-                age_hours = (datetime.now(timezone.utc) - first_seen).total_seconds() / 3600
-                
-                if age_hours > self.config['cache_duration_hours']:
-                    continue
-                
-                # Get cached article for comparison (simplified - in real implementation would store more data)
-                # For now, we'll just use title similarity as primary check
-                cached_title = metadata.__dict__.get('title', '')
-                if cached_title:
-                    title_similarity = self.calculate_similarity(article.title, cached_title)
-                    
-                    if title_similarity >= title_threshold:
+            # Check title against the index – O(1) instead of walking the whole cache.
+            # Keyed per source: the same headline from other outlets must reach the
+            # cross-source story count in comprehensive_scrape (global_event)
+            cached_hash = self.title_index.get((article.source_name, self._title_key(article.title)))
+            if cached_hash is not None:
+                metadata = self.article_cache.get(cached_hash)
+                if metadata is not None:
+                    first_seen = datetime.fromisoformat(metadata.first_seen.replace('Z', '+00:00'))
+                    age_hours = (datetime.now(timezone.utc) - first_seen).total_seconds() / 3600
+                    if age_hours <= self.config['cache_duration_hours']:
                         return True, cached_hash
             
             return False, None
@@ -193,6 +275,9 @@ class EnhancedDeduplicator:
                     processing_history=[processing_stage],
                     source_priority=self._get_source_priority(article.source_name)
                 )
+                self.title_index.setdefault(
+                    (article.source_name, self._title_key(article.title)), article.content_hash
+                )
             else:
                 # Update existing entry
                 metadata = self.article_cache[article.content_hash]
@@ -202,12 +287,7 @@ class EnhancedDeduplicator:
     
     def _get_source_priority(self, source_name: str) -> int:
         """Get priority score for source (higher = more reliable)"""
-        if source_name in self.config['high_reliability_sources']:
-            return 10
-        elif source_name in self.config['breaking_news_priority_sources']:
-            return 8
-        else:
-            return 5
+        return self.source_priorities.get(source_name, 5)
     
     def cleanup_old_cache(self):
         """Remove old entries from cache"""
@@ -225,9 +305,12 @@ class EnhancedDeduplicator:
             
             for cache_hash in to_remove:
                 del self.article_cache[cache_hash]
+            if to_remove:
+                removed = set(to_remove)
+                self.title_index = {k: h for k, h in self.title_index.items() if h not in removed}
             
             if to_remove:
-                logger.debug(f"🧹 Cleaned up {len(to_remove)} old cache entries")
+                logger.debug("🧹 Cleaned up %d old cache entries", len(to_remove))
 
 class SmartScraper:
     """
@@ -238,56 +321,30 @@ class SmartScraper:
         # Configuration
         self.scraping_config = _SCRAPER_CFG
         
-        # EXACT same feed URLs as proven manual system
-        self.feed_urls = {
-            # Major French Newspapers
-            "Le Monde": "http://www.lemonde.fr/rss/une.xml",
-            "Le Figaro": "http://www.lefigaro.fr/rss/figaro_actualites.xml",
-            "Liberation": "https://www.liberation.fr/rss/",
-            "Le Parisien": "https://feeds.leparisien.fr/leparisien/rss",
-            "L'Express": "https://www.lexpress.fr/arc/outboundfeeds/rss/alaune.xml",
-            "Le Point": "http://www.lepoint.fr/rss.xml",
-            "L'Obs": "http://tempsreel.nouvelobs.com/rss.xml",
-            "La Croix": "https://www.la-croix.com/RSS",
-            
-            # TV/Radio News
-            "BFM TV": "https://www.bfmtv.com/rss/news-24-7/",
-            "France Info": "https://www.francetvinfo.fr/titres.rss",
-            "France Inter": "https://www.franceinter.fr/rss",
-            "Europe 1": "https://www.europe1.fr/rss.xml",
-            "France 24": "https://www.france24.com/fr/rss",
-            "RFI": "https://rfi.fr/fr/rss",
-            
-            # Regional/Specialized
-            "Ouest France": "https://www.ouest-france.fr/rss/une",
-            "20 Minutes": "https://partner-feeds.20min.ch/rss/20minutes",
-            "AFP": "https://www.afp.com/fr/actus/afp_actualite/792,31,9,7,33/feed",
-            
-            # Alternative/Independent
-            "Mediapart": "https://www.mediapart.fr/articles/feed",
-            "Brief.me": "https://brief.me/rss",
-            
-            # Categories from Le Monde
-            "Le Monde Politique": "https://www.lemonde.fr/politique/rss_full.xml",
-            "Le Monde International": "https://www.lemonde.fr/international/rss_full.xml",
-            "Le Monde Economie": "https://www.lemonde.fr/economie/rss_full.xml",
-            "Le Monde Culture": "https://www.lemonde.fr/culture/rss_full.xml",
-            "Le Monde Sport": "https://www.lemonde.fr/sport/rss_full.xml",
-            "Le Monde Sciences": "https://www.lemonde.fr/sciences/rss_full.xml",
-        }
+        self.feed_urls = FEED_URLS
         
         # Request session for connection pooling
         self.session = requests.Session()
+        self.request_timeout = self.scraping_config['request_timeout_seconds']
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Size the connection pools to our feeds: one pool per host (requests keeps only
+        # 10 by default, evicting keep-alive connections between scans) and as many
+        # connections per host as scraping threads, so lemonde.fr sub-feeds share sockets.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=max(10, len(_FEED_HOSTS)),
+            pool_maxsize=self.scraping_config['parallel_scraping_threads'],
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Enhanced deduplication system
         self.deduplicator = EnhancedDeduplicator(self.scraping_config)
         
         # Lightweight persistent de-dup across runs
         self._dedup_store = DedupStore()
-        self._feed_cache = FeedCache()
+        self._archive_thread: Optional[threading.Thread] = None
         
         # Source tracking
         self.failed_sources = set()
@@ -296,20 +353,31 @@ class SmartScraper:
         
         # Breaking news keywords from config
         self.breaking_keywords = _SCHED_CFG['breaking_news_keywords']
+        # (lowercased keyword, weight) pairs – resolved once, not per article
+        self._breaking_weights = [
+            (keyword.lower(), _urgency_weight(keyword)) for keyword in self.breaking_keywords
+        ]
         
         # Thread safety
         self.scraping_lock = threading.Lock()
         
-        logger.info("🤖 Enhanced Smart Scraper initialized")
-        logger.info(f"📰 Configured sources: {len(self.feed_urls)}")
-        logger.info(f"🔧 Deduplication enabled: {self.scraping_config['enable_duplicate_detection']}")
-        logger.info(f"⏰ Breaking news timeframe: {self.scraping_config['breaking_news_timeframe_hours']} hours")
-        logger.info(f"📊 Max articles per breaking scan: {self.scraping_config['max_total_articles_breaking']}")
+        # One record (one handler lock + one write) for the whole banner
+        logger.info(
+            "🤖 Enhanced Smart Scraper initialized\n"
+            "📰 Configured sources: %d\n"
+            "🔧 Deduplication enabled: %s\n"
+            "⏰ Breaking news timeframe: %s hours\n"
+            "📊 Max articles per breaking scan: %s",
+            len(self.feed_urls),
+            self.scraping_config['enable_duplicate_detection'],
+            self.scraping_config['breaking_news_timeframe_hours'],
+            self.scraping_config['max_total_articles_breaking'],
+        )
 
     def create_article_hash(self, title: str, link: str, published: str) -> str:
         """Create unique hash for article (for exact duplicate detection)"""
         content = f"{title}{link}{published}"
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return fast_digest(content)
 
     def create_content_hash(self, title: str, summary: str, content: str = "") -> str:
         """Create content hash for deduplication (delegated to deduplicator)"""
@@ -333,15 +401,12 @@ class SmartScraper:
         else:
             max_total = self.scraping_config['max_total_articles_regular']
         
-        # Sort by urgency score and source priority
-        prioritized = sorted(articles, key=lambda x: (
+        # Keep the top max_total by urgency score and source priority (returned best-first)
+        limited = heapq.nlargest(max_total, articles, key=lambda x: (
             x.urgency_score,
             self.deduplicator._get_source_priority(x.source_name),
             x.published_parsed or "1970-01-01"
-        ), reverse=True)
-        
-        # Apply total limit
-        limited = prioritized[:max_total]
+        ))
         
         if len(articles) > max_total:
             logger.info(f"📊 Applied {scan_type} limit: {len(limited)}/{len(articles)} articles selected")
@@ -400,26 +465,13 @@ class SmartScraper:
         score = 0.0
         
         # Check breaking news keywords
-        for keyword in self.breaking_keywords:
-            if keyword.lower() in text:
-                if keyword in ['breaking', 'urgent', 'alerte', 'exclusif']:
-                    score += 3.0  # High urgency
-                elif keyword in ['dernière minute', 'état d\'urgence']:
-                    score += 2.5  # Very high urgency
-                elif keyword in ['gouvernement', 'président', 'crise']:
-                    score += 2.0  # High importance
-                else:
-                    score += 1.0  # Medium importance
+        for keyword, weight in self._breaking_weights:
+            if keyword in text:
+                score += weight
         
         # Check for time-sensitive language
-        urgent_patterns = [
-            r'\b(?:maintenant|immédiatement|urgent|breaking)\b',
-            r'\b(?:en cours|actuellement|ce matin)\b',
-            r'\b(?:annonce|révèle|confirme)\b'
-        ]
-        
-        for pattern in urgent_patterns:
-            if re.search(pattern, text):
+        for pattern in _URGENT_PATTERNS:
+            if pattern.search(text):
                 score += 0.5
         
         return min(score, 10.0)  # Cap at 10.0
@@ -429,7 +481,8 @@ class SmartScraper:
         
         # Extract basic info
         title = self.clean_text(entry.get('title', ''))
-        summary = self.clean_text(entry.get('summary', '') or entry.get('description', ''))
+        # feedparser exposes RSS <description> as 'summary' (the lxml path does the same)
+        summary = self.clean_text(entry.get('summary', ''))
         link = entry.get('link', '')
         
         # Handle publication date
@@ -469,7 +522,7 @@ class SmartScraper:
         
         # Generate unique hash
         hash_content = f"{title}_{link}_{published}_{source_name}"
-        article_hash = hashlib.md5(hash_content.encode()).hexdigest()
+        article_hash = fast_digest(hash_content)
         
         # Calculate urgency score for breaking news
         urgency_score = self.calculate_urgency_score(title, summary)
@@ -524,7 +577,7 @@ class SmartScraper:
                           breaking_news_only: bool = False, scan_type: str = "regular") -> List[NewsArticle]:
         """Enhanced scraping with deduplication and intelligent limits"""
         if source_name in self.failed_sources:
-            logger.debug(f"⏭️ Skipping failed source: {source_name}")
+            logger.debug("⏭️ Skipping failed source: %s", source_name)
             return []
         
         articles = []
@@ -536,40 +589,56 @@ class SmartScraper:
             max_per_source = self.scraping_config['max_articles_per_source_regular']
         
         try:
-            logger.debug(f"📡 Scraping {source_name}: {feed_url} (max: {max_per_source})")
-            
-            # Get the feed with timeout
-            timeout = self.scraping_config['request_timeout_seconds']
-            response = self.session.get(feed_url, timeout=timeout)
-            response.raise_for_status()
-            
-            # Parse the feed
-            feed = feedparser.parse(response.content)
+            logger.debug("📡 Scraping %s: %s (max: %d)", source_name, feed_url, max_per_source)
             
-            if feed.bozo:
-                logger.warning(f"⚠️ Feed parsing issues for {source_name}: {feed.bozo_exception}")
+            # Get the feed with timeout. The body is streamed: urllib3 gunzips each chunk as it
+            # arrives and plain RSS 2.0 is parsed by lxml in step with the download.
+            body: List[bytes] = []
+            with self.session.get(feed_url, timeout=self.request_timeout, stream=True) as response:
+                response.raise_for_status()
+                entries = parse_rss_stream(response.iter_content(FEED_CHUNK_SIZE), body)
+                content_type = response.headers.get("Content-Type", "")
             
             # Track source reliability
             self.source_reliability[source_name] = self.source_reliability.get(source_name, 0) + 1
             self.source_last_success[source_name] = datetime.now(timezone.utc).isoformat()
             
+            # Atom/RDF/broken XML fall back to feedparser
+            if entries is None:
+                # Parse the raw bytes (never response.text, which runs charset sniffing over the
+                # whole body); pass the declared Content-Type so feedparser can pick the encoding
+                # without guessing.
+                feed = feedparser.parse(
+                    b"".join(body),
+                    response_headers={"content-type": content_type},
+                )
+                
+                if feed.bozo:
+                    logger.warning(f"⚠️ Feed parsing issues for {source_name}: {feed.bozo_exception}")
+                entries = feed.entries
+            
             # Get appropriate time filter
             time_cutoff = self.get_time_filter(scan_type)
             
             # Process entries with intelligent limits
             processed_count = 0
-            for entry in feed.entries:
+            for entry in entries:
                 if processed_count >= max_per_source:
-                    logger.debug(f"📊 {source_name}: Reached per-source limit ({max_per_source})")
+                    logger.debug("📊 %s: Reached per-source limit (%d)", source_name, max_per_source)
                     break
                 
+                # Untitled or link-less items never reach the site – skip them before the
+                # cleaning, hashing and scoring in parse_feed_entry
+                if not entry.get('title') or not entry.get('link'):
+                    continue
+                
                 try:
                     article = self.parse_feed_entry(entry, source_name, feed_url)
                     
                     # Check for duplicates first (most important check)
                     is_duplicate, original_hash = self.deduplicator.is_duplicate(article)
                     if is_duplicate:
-                        logger.debug(f"🔄 Duplicate detected: {article.title[:30]}... (original: {original_hash[:8]})")
+                        logger.debug("🔄 Duplicate detected: %.30s... (original: %.8s)", article.title, original_hash)
                         continue
                     
                     # Time filtering
@@ -582,7 +651,7 @@ class SmartScraper:
                             
                             if article_date < time_cutoff:
                                 include_article = False
-                                logger.debug(f"⏰ Article too old: {article.title[:30]}...")
+                                logger.debug("⏰ Article too old: %.30s...", article.title)
                         except:
                             pass  # Include if date parsing fails
                     
@@ -597,13 +666,13 @@ class SmartScraper:
                         processed_count += 1
                         
                         if article.breaking_news:
-                            logger.info(f"🚨 Breaking news: {article.title[:50]}...")
+                            logger.info("🚨 Breaking news: %.50s...", article.title)
                         
                 except Exception as e:
                     logger.warning(f"⚠️ Error parsing entry from {source_name}: {e}")
                     continue
             
-            logger.debug(f"✅ {source_name}: {len(articles)} articles collected")
+            logger.debug("✅ %s: %d articles collected", source_name, len(articles))
             
         except requests.RequestException as e:
             logger.warning(f"❌ Request failed for {source_name}: {e}")
@@ -631,7 +700,7 @@ class SmartScraper:
         }
         
         all_articles = []
-        scan_start_time = time.time()
+        scan_start_time = time.monotonic()
         
         # Clean up old cache entries before scanning
         self.deduplicator.cleanup_old_cache()
@@ -647,7 +716,7 @@ class SmartScraper:
                 try:
                     articles = future.result()
                     all_articles.extend(articles)
-                    logger.debug(f"📰 {source}: {len(articles)} breaking news articles")
+                    logger.debug("📰 %s: %d breaking news articles", source, len(articles))
                 except Exception as e:
                     logger.warning(f"⚠️ Breaking news scan failed for {source}: {e}")
         
@@ -657,12 +726,12 @@ class SmartScraper:
         # Final filtering for highest urgency
         breaking_articles = [a for a in limited_articles if a.urgency_score >= 2.0]
         
-        scan_duration = time.time() - scan_start_time
+        scan_duration = time.monotonic() - scan_start_time
         logger.info(f"🚨 Breaking news scan complete: {len(breaking_articles)}/{len(all_articles)} articles selected in {scan_duration:.2f}s")
         
         # Log deduplication stats
         total_cache_size = len(self.deduplicator.article_cache)
-        logger.debug(f"📊 Deduplication cache size: {total_cache_size} articles")
+        logger.debug("📊 Deduplication cache size: %d articles", total_cache_size)
         
         return breaking_articles
     
@@ -671,7 +740,8 @@ class SmartScraper:
         logger.info("🔄 Enhanced comprehensive scraping with deduplication...")
         
         all_articles = []
-        scrape_start_time = time.time()
+        # monotonic: elapsed time must not jump with NTP corrections
+        scrape_start_time = time.monotonic()
         failed_sources_count = 0
         
         # Clean up old cache entries before major scraping
@@ -698,7 +768,7 @@ class SmartScraper:
                 try:
                     articles = future.result()
                     all_articles.extend(articles)
-                    logger.debug(f"📰 {source}: {len(articles)} articles collected")
+                    logger.debug("📰 %s: %d articles collected", source, len(articles))
                 except Exception as e:
                     logger.error(f"❌ Comprehensive scrape failed for {source}: {e}")
                     failed_sources_count += 1
@@ -706,35 +776,34 @@ class SmartScraper:
         # Apply intelligent limits and prioritization
         limited_articles = self.apply_article_limits(all_articles, "regular")
         
-        # Sort final results by urgency and source priority
-        final_articles = sorted(limited_articles, key=lambda x: (
-            x.urgency_score,
-            self.deduplicator._get_source_priority(x.source_name),
-            x.published_parsed or "1970-01-01"
-        ), reverse=True)
+        # Already ordered by urgency and source priority
+        final_articles = limited_articles
         
-        scrape_duration = time.time() - scrape_start_time
-        breaking_count = len([a for a in final_articles if a.breaking_news])
+        scrape_duration = time.monotonic() - scrape_start_time
+        breaking_count = sum(1 for a in final_articles if a.breaking_news)
         
         # ---------------- Detect cross-source global events ----------------
-        story_counts: Dict[str, int] = {}
-        for art in final_articles:
-            norm_title = re.sub(r"[^\w\s]", "", art.title.lower())
-            story_id = hashlib.md5(norm_title.encode()).hexdigest()
-            story_counts[story_id] = story_counts.get(story_id, 0) + 1
-
-        for art in final_articles:
-            norm_title = re.sub(r"[^\w\s]", "", art.title.lower())
-            story_id = hashlib.md5(norm_title.encode()).hexdigest()
-            if story_counts.get(story_id, 0) >= 4:
+        # Normalised titles are computed once into a list parallel to final_articles
+        story_ids = [re.sub(r"[^\w\s]", "", art.title.lower()) for art in final_articles]
+        story_counts = Counter(story_ids)
+        for art, story_id in zip(final_articles, story_ids):
+            if story_counts[story_id] >= 4:
                 art.global_event = True
 
-        logger.info(f"📊 Comprehensive scrape complete in {scrape_duration:.2f}s:")
-        logger.info(f"   📄 Total articles: {len(final_articles)} (from {len(all_articles)} raw)")
-        logger.info(f"   🚨 Breaking news: {breaking_count}")
-        logger.info(f"   ❌ Failed sources: {failed_sources_count}")
-        logger.info(f"   🔄 Duplicates filtered: {len(all_articles) - len(limited_articles)}")
-        logger.info(f"   📊 Cache size: {len(self.deduplicator.article_cache)}")
+        logger.info(
+            "📊 Comprehensive scrape complete in %.2fs:\n"
+            "   📄 Total articles: %d (from %d raw)\n"
+            "   🚨 Breaking news: %d\n"
+            "   ❌ Failed sources: %d\n"
+            "   🔄 Duplicates filtered: %d\n"
+            "   📊 Cache size: %d",
+            scrape_duration,
+            len(final_articles), len(all_articles),
+            breaking_count,
+            failed_sources_count,
+            len(all_articles) - len(limited_articles),
+            len(self.deduplicator.article_cache),
+        )
         
         # At this point, all scraping threads have completed
         # Basic language & duplicate filter (v2 additions)
@@ -751,10 +820,11 @@ class SmartScraper:
                 continue
 
             cleaned.append(art)
+        self._dedup_store.flush()
 
-        # Archive raw scrape for analysis before any filters
+        # Archive raw scrape for analysis before any filters (written in the background)
         try:
-            self._archive_raw(all_articles)
+            self._archive_thread = self._archive_raw(all_articles)
         except Exception as _e:
             logger.debug("Could not archive raw scrape: %s", _e)
 
@@ -811,7 +881,7 @@ class SmartScraper:
                 "curated_articles_count": len(articles),
                 "update_type": "automated_scraping",
                 "average_score": 20.0,  # Default average
-                "breaking_news_count": len([a for a in articles if a.breaking_news]),
+                "breaking_news_count": sum(1 for a in articles if a.breaking_news),
                 "sources_scraped": len(set(a.source_name for a in articles)),
                 "scraper_version": "Smart Scraper 1.0"
             },
@@ -843,11 +913,11 @@ class SmartScraper:
         """Get detailed processing and deduplication statistics"""
         with self.scraping_lock:
             cache_stats = {}
-            processing_stages = {}
-            
-            for cache_hash, metadata in self.deduplicator.article_cache.items():
-                for stage in metadata.processing_history:
-                    processing_stages[stage] = processing_stages.get(stage, 0) + 1
+            processing_stages = Counter(
+                stage
+                for metadata in self.deduplicator.article_cache.values()
+                for stage in metadata.processing_history
+            )
             
             return {
                 "scraping_stats": {
@@ -859,7 +929,7 @@ class SmartScraper:
                 "deduplication_stats": {
                     "cache_size": len(self.deduplicator.article_cache),
                     "similarity_cache_size": len(self.deduplicator.similarity_cache),
-                    "processing_stages": processing_stages
+                    "processing_stages": dict(processing_stages)
                 },
                 "configuration": {
                     "breaking_timeframe_hours": self.scraping_config['breaking_news_timeframe_hours'],
@@ -874,17 +944,35 @@ class SmartScraper:
     # Helper: archive raw scrape
     # ---------------------------------------------------------------------
 
-    def _archive_raw(self, raw: List[NewsArticle]):
-        """Save the full unfiltered scrape to data/archive for analytics."""
+    def _archive_raw(self, raw: List[NewsArticle]) -> threading.Thread:
+        """Save the full unfiltered scrape to data/archive for analytics.
+
+        Records are snapshotted here (article_to_record copies the mutable
+        tags and metadata); encoding and gzip run on a background thread so
+        the scrape returns without waiting for the dump.  The thread
+        is not a daemon, so the interpreter still waits for it before exiting.
+        """
         out_dir = Path(__file__).resolve().parent.parent / "data" / "raw_archive"
         out_dir = out_dir.resolve()
         out_dir.mkdir(parents=True, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = out_dir / f"raw_scrape_{ts}.json"
-        payload = [a.__dict__ for a in raw]
-        import json
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
-        logger.info("📑 Archived raw scrape (%d items) → %s", len(raw), path)
+        path = out_dir / f"raw_scrape_{ts}.json.gz"
+        payload = [article_to_record(a) for a in raw]
+
+        def write():
+            import gzip
+            try:
+                # Forensic dump only – nothing re-reads it, so trade pretty output for size
+                with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as fh:
+                    json.dump(payload, fh, ensure_ascii=False)
+            except Exception as e:
+                logger.debug("Could not archive raw scrape: %s", e)
+                return
+            logger.info("📑 Archived raw scrape (%d items) → %s", len(payload), path)
+
+        thread = threading.Thread(target=write, name="raw-archive")
+        thread.start()
+        return thread
 
 # Test function for development
 def test_smart_scraper():
@@ -18,6 +18,10 @@ from .validator import (
 
 logger = logging.getLogger(__name__)
 
+# The titles JSON (two ≤60-char titles, two ~25-word summaries, two labels) fits in
+# ~250 tokens; a tight cap stops a rambling reply from decoding the full default budget.
+TITLES_MAX_TOKENS = 800
+
 
 class ProcessorV2:
     def __init__(self, model: str | None = None):
@@ -49,7 +53,9 @@ class ProcessorV2:
             return None
 
     # ---------------- internal helpers ----------------
-    def _chat_with_validation(self, messages, render_fn, article: Article, validate_fn, max_attempts: int = 3):
+    def _chat_with_validation(
+        self, messages, render_fn, article: Article, validate_fn, max_attempts: int = 3, max_tokens: int = 1500
+    ):
         """Send chat completion and ensure *validate_fn* passes.
 
         If the first attempt fails JSON validation we send a follow-up user
@@ -65,7 +71,7 @@ class ProcessorV2:
                     render_fn(article)
                     + "\n\nCRITICAL: The bold heading BEFORE the colon must be a concise ENGLISH translation (1–3 words, capitalised) and must NOT repeat the French token or contain accents.  Respond ONLY with valid JSON and no markdown fences."
                 )
-            response = self.llm.chat(messages)
+            response = self.llm.chat(messages, max_tokens=max_tokens)
             self._add_cost(self.llm.last_usage)
             ok, payload, _reason = validate_fn(response or "")
             if ok and payload:
@@ -101,7 +107,7 @@ class ProcessorV2:
             {"role": "user", "content": self._render_title_prompt(article)},
         ]
         ok1, payload1 = self._chat_with_validation(
-            msg_stack, self._render_title_prompt, article, validate_titles_payload
+            msg_stack, self._render_title_prompt, article, validate_titles_payload, max_tokens=TITLES_MAX_TOKENS
         )
         if not ok1:
             logger.error(
@@ -3,9 +3,12 @@ from __future__ import annotations
 Store each profile as simple JSON in `profiles/<user_id>.json`.
 """
 import json, pathlib
+from functools import cached_property, lru_cache
 from typing import List
 from pydantic import BaseModel, Field
 
+from .pipeline.utils import fold_text
+
 PROFILES_DIR = pathlib.Path(__file__).resolve().parent / "profiles"
 PROFILES_DIR.mkdir(exist_ok=True)
 
@@ -21,13 +24,25 @@ class UserProfile(BaseModel):
     # --------------------------------------------------------- helpers
     @classmethod
     def load(cls, path_or_user: str | pathlib.Path):
+        """Load a profile; repeat loads of an unchanged file reuse the parsed object."""
         path = pathlib.Path(path_or_user)
         if not path.suffix:
             path = PROFILES_DIR / f"{path_or_user}.json"
-        data = json.loads(path.read_text())
-        return cls.parse_obj(data)
+        path = path.resolve()
+        return _load_cached(cls, path, path.stat().st_mtime_ns)
+
+    @cached_property
+    def keywords(self) -> tuple[str, ...]:
+        """Accent-folded work domains, pain points and interests (folded once per profile)."""
+        return tuple(fold_text(kw) for kw in self.work_domains + self.pain_points + self.interests)
 
     def save(self):
         path = PROFILES_DIR / f"{self.user_id}.json"
         path.write_text(self.json(indent=2, ensure_ascii=False))
-        return path 
\ No newline at end of file
+        return path
+
+
+@lru_cache(maxsize=32)
+def _load_cached(cls, path: pathlib.Path, mtime_ns: int) -> UserProfile:
+    # mtime is part of the key so edits (or save()) invalidate the entry
+    return cls.parse_obj(json.loads(path.read_text()))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 """LLM-based relevance scorer for Better French v3."""
 
-import logging
+import hashlib, json, logging, os, pathlib, re, time
 import config.api_config  # noqa: F401 side-effect
 from ai_engine_v3.client import LLMClient
 
@@ -14,26 +14,97 @@ _PROMPT = (
     "HEADLINE: \"{headline}\"\n\nRespond with ONLY the number."
 )
 
-_llm = LLMClient(model="mistralai/mistral-large-2411")
+# A single 0-10 number needs no large model; a flash tier answers faster, at roughly
+# 1/7 of mistral-large's input price and 1/2.4 of its output price
+MODEL = os.getenv("BF_RELEVANCE_MODEL", "google/gemini-2.5-flash")
+_llm = LLMClient(model=MODEL)
+
+# Gemini 2.5 Flash thinks by default; reasoning tokens count against max_tokens, so
+# it is switched off and the budget leaves headroom over the 1-4 token answer
+_REASONING = {"enabled": False}
+_MAX_TOKENS = 16
+
+# Cost constants for the default model (USD per 1k tokens)
+_IN_PRICE = 0.0003
+_OUT_PRICE = 0.0025
+
+# headline digest -> [score, unix time]; repeat headlines (same story, several feeds,
+# or a later run) skip the API. Persisted between hourly runs by flush_cache().
+CACHE_PATH = pathlib.Path(__file__).resolve().parent / "data" / "_cache" / "relevance_scores.json"
+CACHE_TTL_S = 24 * 3600
+_SCORE_CACHE: dict[str, list] | None = None
+_cache_dirty = False
+
+# First number in the reply – tolerates "7", " 7.5\n", "8/10" or "Score: 6,5"; the sign
+# is kept so "-3" fails the 0-10 range check instead of passing as 3
+_NUMBER_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+
+
+def _parse_score(reply: str) -> float | None:
+    match = _NUMBER_RE.search(reply)
+    if match is None:
+        return None
+    value = float(match.group().replace(",", "."))
+    return value if 0 <= value <= 10 else None
+
+
+def _cache() -> dict[str, list]:
+    global _SCORE_CACHE
+    if _SCORE_CACHE is None:
+        try:
+            data = json.loads(CACHE_PATH.read_text())
+        except FileNotFoundError:
+            data = {}
+        except ValueError as e:
+            logger.warning("Relevance cache %s is corrupt, starting empty: %s", CACHE_PATH, e)
+            data = {}
+        cutoff = time.time() - CACHE_TTL_S
+        _SCORE_CACHE = {k: v for k, v in data.items() if v[1] >= cutoff}
+    return _SCORE_CACHE
+
+
+def flush_cache():
+    """Persist newly scored headlines (no-op when nothing was scored)."""
+    global _cache_dirty
+    if not _cache_dirty:
+        return
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # temp file + rename (like Storage._save) so a crash never leaves truncated JSON behind
+    tmp = CACHE_PATH.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        json.dump(_SCORE_CACHE, fh, separators=(",", ":"))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, CACHE_PATH)
+    _cache_dirty = False
 
-# Cost constants for current model (USD per 1k tokens)
-_IN_PRICE = 0.00200
-_OUT_PRICE = 0.00600
 
 def score(headline: str):
     """Return (score, usd_cost) tuple."""
+    global _cache_dirty
+    # model is part of the key so switching models never reuses another model's scores
+    key = hashlib.blake2b(f"{MODEL}\0{headline.strip().lower()}".encode("utf-8"), digest_size=8).hexdigest()
+    cached = _cache().get(key)
+    if cached is not None:
+        return cached[0], 0.0
     msg = [{"role": "user", "content": _PROMPT.format(headline=headline)}]
     try:
-        reply = _llm.chat(msg, max_tokens=5, temperature=0)
-        if reply:
-            value = float(reply.strip())
-            if 0 <= value <= 10:
-                # cost estimate based on last_usage
-                usage = _llm.last_usage or {}
-                in_t = usage.get("prompt_tokens", 0)
-                out_t = usage.get("completion_tokens", 0)
-                usd = (in_t/1000)*_IN_PRICE + (out_t/1000)*_OUT_PRICE
-                return value, usd
+        reply = _llm.chat(msg, max_tokens=_MAX_TOKENS, temperature=0, reasoning=_REASONING)
+        if not reply:
+            # None (request failed) or empty (budget spent before any answer): score 0 for
+            # this run only – nothing is cached, so the headline is retried next run
+            logger.warning("LLM relevance scoring returned no answer for %.50s", headline)
+            return 0.0, 0.0
+        value = _parse_score(reply)
+        if value is not None:
+            # cost estimate based on last_usage
+            usage = _llm.last_usage or {}
+            in_t = usage.get("prompt_tokens", 0)
+            out_t = usage.get("completion_tokens", 0)
+            usd = (in_t/1000)*_IN_PRICE + (out_t/1000)*_OUT_PRICE
+            _cache()[key] = [value, int(time.time())]
+            _cache_dirty = True
+            return value, usd
     except Exception as e:
         logger.warning("LLM relevance scoring failed: %s", e)
     return 0.0, 0.0 
\ No newline at end of file
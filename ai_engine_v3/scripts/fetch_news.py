@@ -5,7 +5,7 @@ Saves to ai_engine_v3/data/raw_archive/raw_scrape_<timestamp>.json
 from __future__ import annotations
 
 import datetime, pathlib, json, logging, argparse, hashlib, json
-from ai_engine_v3.pipeline.scraper import SmartScraper
+from ai_engine_v3.pipeline.scraper import SmartScraper, article_to_record
 import shutil
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -81,7 +81,7 @@ def main():
     day_dir = RAW_DIR / now.strftime("%Y-%m-%d")
     day_dir.mkdir(parents=True, exist_ok=True)
     out_path = day_dir / f"{ts}_delta.json"
-    articles_payload = [a.__dict__ for a in new_items]
+    articles_payload = [article_to_record(a) for a in new_items]
 
     json.dump(articles_payload, out_path.open("w", encoding="utf-8"), ensure_ascii=False)
     _save_visited(visited)
@@ -4,10 +4,16 @@ Run every 1-2 hours.
 """
 from __future__ import annotations
 
-import pathlib, json, datetime, logging, os, sys
+import pathlib, json, datetime, heapq, logging, os, sys
+from operator import itemgetter
+
+try:
+    import orjson  # optional – C codec for the delta files and overflow queue
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
 
 from ai_engine_v3.pipeline.curator_v2 import CuratorV2
-from ai_engine_v3.relevance_llm import score as llm_score
+from ai_engine_v3.relevance_llm import score as llm_score, flush_cache as flush_llm_cache
 from ai_engine_v3.storage import Storage
 from ai_engine_v3.processor import ProcessorV2
 from ai_engine_v3.models import Article
@@ -15,12 +21,18 @@ from ai_engine_v3.models import Article
 PKG_ROOT = pathlib.Path(__file__).resolve().parent.parent  # ai_engine_v3/
 RAW_DIR = PKG_ROOT / "data" / "raw_archive"
 STATE_FILE = PKG_ROOT / "data" / "state.json"
-OVERFLOW_FILE = PKG_ROOT / "data" / "live" / "overflow.json"
+OVERFLOW_FILE = PKG_ROOT / "data" / "live" / "overflow.json"  # dir created by storage on import
 STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
+
+def _read_json(path: pathlib.Path):
+    """Parse a JSON file from its UTF-8 bytes (no str decode pass, locale-independent)."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 # ------------------------------------------------------------------
 # Publication caps
 # ------------------------------------------------------------------
@@ -29,6 +41,8 @@ logger = logging.getLogger(__name__)
 #   • If unset, "0", "none" or "unlimited"  ⇒  no daily ceiling (effectively ∞).
 #   • Otherwise, use the integer value provided.
 
+PER_RUN_CAP = int(os.getenv("BF_PER_RUN_CAP", "20"))
+
 _daily_cap_raw = os.getenv("BF_DAILY_CAP", "").strip().lower()
 
 if _daily_cap_raw in {"", "0", "none", "unlimited"}:
@@ -42,6 +56,27 @@ else:
 
 MIN_RULE_SCORE = float(os.getenv("BF_MIN_RULE_SCORE", "12"))
 
+# blended = RULE_WEIGHT * rule score + LLM_WEIGHT * LLM relevance (0-10)
+RULE_WEIGHT = 0.6
+LLM_WEIGHT = 0.4
+LLM_MAX_SCORE = 10.0
+OVERFLOW_CAP = 100
+
+
+def _llm_candidates(fresh: list, carry_scores: list[float], keep: int) -> list:
+    """Fresh articles whose blended score could still land in the top *keep*.
+
+    The LLM only adds 0-4 points, so an article whose best case stays below the
+    *keep*-th guaranteed score (carried-over scores, or other articles' worst
+    case) is dropped before we pay for a relevance call.
+    """
+    floors = carry_scores + [RULE_WEIGHT * a.total_score for a in fresh]
+    if len(floors) <= keep:
+        return fresh
+    cutoff = heapq.nlargest(keep, floors)[-1]
+    # + 0.01 absorbs the two-decimal rounding of blended scores
+    return [a for a in fresh if RULE_WEIGHT * a.total_score + LLM_WEIGHT * LLM_MAX_SCORE + 0.01 >= cutoff]
+
 # ----------------------------------------------------- state helpers
 
 def _load_state():
@@ -69,6 +104,9 @@ def _save_state(state: dict):
 # ----------------------------------------------------- main
 
 def main():
+    # one clock read per run: queue ages and queued_at stamps all use the run start
+    now = datetime.datetime.utcnow()
+    now_iso = now.isoformat()
     state = _load_state()
     today = datetime.date.today().isoformat()
     if state.get("date") != today:
@@ -77,8 +115,19 @@ def main():
 
     # 1. gather new delta files ------------------------------------
     last_delta = state.get("last_delta", "")
+    # Deltas live in YYYY-MM-DD day dirs (kept 90 days); only days on or after the
+    # last processed delta can hold new files, so older dirs are never listed
+    since_day = f"{last_delta[:4]}-{last_delta[4:6]}-{last_delta[6:8]}" if last_delta else ""
+    # raw_archive is only created by the first fetch
+    day_dirs = RAW_DIR.iterdir() if RAW_DIR.is_dir() else ()
     new_paths = sorted(
-        (p for p in RAW_DIR.rglob("*_delta.json") if p.name > last_delta),
+        (
+            p
+            for day_dir in day_dirs
+            if day_dir.is_dir() and day_dir.name >= since_day
+            for p in day_dir.glob("*_delta.json")
+            if p.name > last_delta
+        ),
         key=lambda p: p.name,
     )
 
@@ -89,7 +138,7 @@ def main():
     raw_articles = []
     from ai_engine_v3.pipeline.scraper import NewsArticle  # type: ignore
     for path in new_paths:
-        data = json.loads(path.read_text())
+        data = _read_json(path)
         articles_list = data.get("articles") if isinstance(data, dict) else data
         for d in articles_list or []:
             try:
@@ -111,33 +160,13 @@ def main():
 
     logger.info("%d articles remain after removing already-published links", len(fresh))
 
-    # 4. LLM relevance score  (only for fresh candidates) --------------
-    blended: list[tuple[float, Any]] = []  # (score, curator_obj)
-    rel_cost_total = 0.0
-    if fresh:
-        logger.info("Scoring relevance for %d candidate articles via LLM …", len(fresh))
-
-    for idx, art in enumerate(fresh, 1):
-        if len(fresh) <= 40 or idx % 10 == 1:
-            logger.info("  [LLM] %3d/%d · %s", idx, len(fresh), art.original_data.get("title", "")[:80])
-
-        rel, usd = llm_score(art.original_data.get("title", ""))
-        rel_cost_total += usd
-        blended_score = 0.6 * art.total_score + 0.4 * rel
-        # attach for downstream use
-        art.original_data["blended_score"] = blended_score
-        art.original_data["queued_at"] = datetime.datetime.utcnow().isoformat()
-        blended.append((blended_score, art))
-
-    blended.sort(key=lambda x: x[0], reverse=True)
-
     # ------------------------------------------------------------------
-    # 5. Load overflow queue -------------------------------------------
+    # 4. Load overflow queue -------------------------------------------
     # ------------------------------------------------------------------
     carry_over: list[tuple[float, dict]] = []
     if OVERFLOW_FILE.exists():
         try:
-            overflow_payload = json.loads(OVERFLOW_FILE.read_text())
+            overflow_payload = _read_json(OVERFLOW_FILE)
             for item in overflow_payload:
                 score = item.get("score", 0)
                 data = item.get("article") or {}
@@ -145,7 +174,7 @@ def main():
                 # expire after 24h
                 if ts:
                     try:
-                        age_h = (datetime.datetime.utcnow() - datetime.datetime.fromisoformat(ts)).total_seconds() / 3600.0
+                        age_h = (now - datetime.datetime.fromisoformat(ts)).total_seconds() / 3600.0
                         if age_h > 24:
                             continue
                     except Exception:
@@ -158,13 +187,8 @@ def main():
             logger.warning("Could not read overflow queue: %s", e)
 
     # ------------------------------------------------------------------
-    # 6. Merge pools and choose top ------------------------------------
+    # 5. Caps – decided before paying for any LLM call -----------------
     # ------------------------------------------------------------------
-    pool: list[tuple[float, Any]] = carry_over + [(sc, art.original_data) for sc, art in blended]
-    pool.sort(key=lambda x: x[0], reverse=True)
-
-    PER_RUN_CAP = int(os.getenv("BF_PER_RUN_CAP", "20"))
-
     # honour both limits: daily and per-run
     remaining_slots = min(PER_RUN_CAP, DAILY_CAP - state["published_today"])
 
@@ -172,9 +196,50 @@ def main():
         logger.info("Run skipped – cap reached (daily %d or per-run %d)", DAILY_CAP, PER_RUN_CAP)
         return
 
+    # Only this run's picks and the 100-item overflow queue are used
+    keep = max(remaining_slots, OVERFLOW_CAP)
+
+    # ------------------------------------------------------------------
+    # 6. LLM relevance score (only for candidates that can still make the cut)
+    # ------------------------------------------------------------------
+    reachable = _llm_candidates(fresh, [sc for sc, _ in carry_over], keep)
+    if len(reachable) < len(fresh):
+        logger.info("Skipping LLM for %d articles that cannot reach the top %d", len(fresh) - len(reachable), keep)
+    # Trivial case: every candidate gets published this run, so LLM scores could not
+    # change the selection – rank on rule scores alone
+    use_llm = len(fresh) + len(carry_over) > remaining_slots
+    if reachable and not use_llm:
+        logger.info("All %d candidates fit in %d slots – skipping LLM relevance", len(fresh) + len(carry_over), remaining_slots)
+
+    blended: list[tuple[float, Any]] = []  # (score, curator_obj)
+    rel_cost_total = 0.0
+    if reachable and use_llm:
+        logger.info("Scoring relevance for %d candidate articles via LLM …", len(reachable))
+
+    for idx, art in enumerate(reachable, 1):
+        rel = 0.0
+        if use_llm:
+            if len(reachable) <= 40 or idx % 10 == 1:
+                logger.info("  [LLM] %3d/%d · %s", idx, len(reachable), art.original_data.get("title", "")[:80])
+            rel, usd = llm_score(art.original_data.get("title", ""))
+            rel_cost_total += usd
+        # two decimals is plenty for ranking and keeps queue/state files compact
+        blended_score = round(RULE_WEIGHT * art.total_score + LLM_WEIGHT * rel, 2)
+        # attach for downstream use
+        art.original_data["blended_score"] = blended_score
+        art.original_data["queued_at"] = now_iso
+        blended.append((blended_score, art))
+    flush_llm_cache()
+
+    # ------------------------------------------------------------------
+    # 7. Merge pools and choose top ------------------------------------
+    # ------------------------------------------------------------------
+    candidates: list[tuple[float, Any]] = carry_over + [(sc, art.original_data) for sc, art in blended]
+    pool = heapq.nlargest(keep, candidates, key=itemgetter(0))
+
     # After bucket filtering we now have pool already; apply same bucket logic? For simplicity keep old logic on pool order.
     selected_raw = pool[:remaining_slots]
-    leftover_raw = pool[remaining_slots:100]  # cap queue to 100
+    leftover_raw = pool[remaining_slots:OVERFLOW_CAP]  # cap queue to 100
 
     selected = []
     for score, data in selected_raw:
@@ -189,12 +254,16 @@ def main():
             {
                 "score": sc,
                 "article": d if isinstance(d, dict) else d.original_data,
-                "queued_at": (d.get("queued_at") if isinstance(d, dict) else datetime.datetime.utcnow().isoformat()),
+                "queued_at": (d.get("queued_at") if isinstance(d, dict) else now_iso),
             }
             for sc, d in leftover_raw
         ]
-        OVERFLOW_FILE.parent.mkdir(parents=True, exist_ok=True)
-        OVERFLOW_FILE.write_text(json.dumps(out_items, ensure_ascii=False, indent=2))
+        if orjson is not None:
+            # same bytes as json.dump(indent=2, ensure_ascii=False), built in one call
+            OVERFLOW_FILE.write_bytes(orjson.dumps(out_items, option=orjson.OPT_INDENT_2))
+        else:
+            with OVERFLOW_FILE.open("w", encoding="utf-8") as fh:
+                json.dump(out_items, fh, ensure_ascii=False, indent=2)
     except Exception as e:
         logger.warning("Could not write overflow queue: %s", e)
 
@@ -226,7 +295,7 @@ def main():
         if "original_article_link" not in data and data.get("link"):
             data["original_article_link"] = data.pop("link")
         if "original_article_published_date" not in data:
-            data["original_article_published_date"] = data.get("published_parsed") or data.get("published") or datetime.datetime.utcnow().isoformat()
+            data["original_article_published_date"] = data.get("published_parsed") or data.get("published") or now_iso
         if "source_name" not in data and data.get("source_name"):
             data["source_name"] = data["source_name"]
 
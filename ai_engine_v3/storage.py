@@ -3,9 +3,14 @@ Manages pending_articles.json and rolling_articles.json with automatic backup.
 """
 from __future__ import annotations
 
-import json, shutil, datetime, pathlib
+import json, os, shutil, datetime, pathlib
 from typing import List
 
+try:
+    import orjson  # optional – C encoder, much faster on the rolling feed
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 from .models import Article
 
 # Use ai_engine_v2 package root as base so the engine can live standalone
@@ -20,6 +25,8 @@ PENDING_FILE = DATA_DIR / "pending_articles.json"
 ROLLING_FILE = WEBSITE_DIR / "rolling_articles.json"
 BACKUP_DIR = WEBSITE_DIR / "backups"
 BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+# One rolling snapshot per hour; older ones are unlinked instead of piling up
+BACKUP_KEEP = 48
 
 
 class Storage:
@@ -27,10 +34,11 @@ class Storage:
 
     @staticmethod
     def _load(path: pathlib.Path) -> List[Article]:
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+            raw = orjson.loads(data) if orjson is not None else json.loads(data)
+        except FileNotFoundError:
             return []
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
         articles = raw.get("articles", []) if isinstance(raw, dict) else raw
         parsed = []
         for item in articles:
@@ -44,10 +52,23 @@ class Storage:
     @staticmethod
     def _save(path: pathlib.Path, articles: List[Article]):
         serializable = [a.model_dump(mode="json", by_alias=True) for a in articles]
+        payload = {"articles": serializable}
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly (no ensure_ascii escaping)
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
         tmp = path.with_suffix(".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump({"articles": serializable}, f, ensure_ascii=False, indent=2)
-        tmp.replace(path)
+        # fsync before the rename so a crash never leaves a truncated feed behind
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:  # os.write may be partial
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
 
     # Public helpers -------------------------------------------------------
     @classmethod
@@ -58,22 +79,36 @@ class Storage:
     def load_rolling(cls) -> List[Article]:
         return cls._load(ROLLING_FILE)
 
+    @staticmethod
+    def _prune_backups():
+        # timestamped names sort chronologically
+        for old in sorted(BACKUP_DIR.glob("rolling_*.json"))[:-BACKUP_KEEP]:
+            old.unlink(missing_ok=True)
+
     @classmethod
     def save_pending(cls, articles: List[Article]):
         cls._save(PENDING_FILE, articles)
 
     @classmethod
     def save_rolling(cls, articles: List[Article]):
-        # backup current
-        if ROLLING_FILE.exists():
-            ts = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        # backup current (a re-run within the same hour overwrites that hour's file)
+        ts = datetime.datetime.utcnow().strftime("%Y%m%d_%H")
+        try:
             shutil.copy2(ROLLING_FILE, BACKUP_DIR / f"rolling_{ts}.json")
+        except FileNotFoundError:
+            pass  # first run – nothing to back up
+        else:
+            cls._prune_backups()
 
         # ---------------- Aggregate & deduplicate ----------------
         # keep the latest version of each unique article (by link)
+        # Single pass – only replace an entry when a newer copy turns up
         dedup: dict[str, Article] = {}
-        for art in sorted(articles, key=lambda a: a.processed_at or "", reverse=True):
-            dedup.setdefault(art.original_article_link, art)
+        for art in articles:
+            link = art.original_article_link
+            kept = dedup.get(link)
+            if kept is None or (art.processed_at or "") > (kept.processed_at or ""):
+                dedup[link] = art
 
         pool = list(dedup.values())
 
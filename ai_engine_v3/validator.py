@@ -10,10 +10,29 @@ import json, logging, re
 from typing import Tuple, Optional, List, Dict, Any
 import json as _json, pathlib as _pl
 
+try:
+    import orjson  # optional – C decoder for the LLM payloads
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 from .models import Article
 
 logger = logging.getLogger(__name__)
 
+# Key sets checked on every LLM reply – built once instead of per call / per item
+_TITLE_KEYS = frozenset({
+    "simplified_french_title",
+    "simplified_english_title",
+    "french_summary",
+    "english_summary",
+    "difficulty",
+    "tone",
+})
+_CEFR_LEVELS = frozenset({"A1", "A2", "B1", "B2", "C1", "C2"})
+_TONES = frozenset({"neutral", "opinion", "satire", "other"})
+_LIST_ITEM_KEYS = frozenset({"original_word", "display_format", "explanation"})
+_DICT_ITEM_KEYS = frozenset({"display_format", "explanation"})
+
 # ---------------------------------------------------------------------------
 # Core validation helpers
 # ---------------------------------------------------------------------------
@@ -32,6 +51,11 @@ def _extract_first_json(text: str) -> Optional[str]:
     return None
 
 
+def _loads(json_str: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(json_str) if orjson is not None else json.loads(json_str)
+
+
 def validate_titles_payload(raw_text: str) -> Tuple[bool, Optional[Dict[str, Any]], str]:
     """Validate LLM answer for titles+summaries prompt.
 
@@ -42,28 +66,20 @@ def validate_titles_payload(raw_text: str) -> Tuple[bool, Optional[Dict[str, Any
     if not json_str:
         return False, None, "No JSON found"
     try:
-        data = json.loads(json_str)
+        data = _loads(json_str)
     except json.JSONDecodeError as e:
         return False, None, f"JSON decode error: {e}"
 
-    required_keys = {
-        "simplified_french_title",
-        "simplified_english_title",
-        "french_summary",
-        "english_summary",
-        "difficulty",
-        "tone",
-    }
-    if not required_keys.issubset(data.keys()):
+    if not _TITLE_KEYS.issubset(data.keys()):
         return False, None, "Missing required keys"
     # quick length checks – keep summaries ≤ 400 chars each
     if len(data["french_summary"]) > 800 or len(data["english_summary"]) > 800:
         return False, None, "Summary too long"
 
     # CEFR and tone validation
-    if data["difficulty"] not in {"A1", "A2", "B1", "B2", "C1", "C2"}:
+    if data["difficulty"] not in _CEFR_LEVELS:
         return False, None, "Invalid difficulty"
-    if data["tone"] not in {"neutral", "opinion", "satire", "other"}:
+    if data["tone"] not in _TONES:
         return False, None, "Invalid tone"
 
     return True, data, "ok"
@@ -80,7 +96,7 @@ def validate_explanations_payload(raw_text: str) -> Tuple[bool, Optional[Any], s
     if not json_str:
         return False, None, "No JSON found"
     try:
-        data = json.loads(json_str)
+        data = _loads(json_str)
     except json.JSONDecodeError as e:
         return False, None, f"JSON decode error: {e}"
 
@@ -90,7 +106,7 @@ def validate_explanations_payload(raw_text: str) -> Tuple[bool, Optional[Any], s
         for obj in data:
             if not isinstance(obj, dict):
                 continue  # skip non-dict
-            if not {"original_word", "display_format", "explanation"}.issubset(obj):
+            if not _LIST_ITEM_KEYS.issubset(obj):
                 continue  # skip incomplete item
 
             # Guard against non-string original_word (e.g. list returned by LLM)
@@ -111,7 +127,9 @@ def validate_explanations_payload(raw_text: str) -> Tuple[bool, Optional[Any], s
         #     if len(with_notes) / len(content_items) < 0.6:
         #         return False, None, "insufficient cultural notes"
 
-        return (len(cleaned) > 0), cleaned if cleaned else None, "partial_ok" if cleaned else "no valid items"
+        if cleaned:
+            return True, cleaned, "partial_ok"
+        return False, None, "no valid items"
 
     # -------- dict format --------
     if isinstance(data, dict):
@@ -122,7 +140,7 @@ def validate_explanations_payload(raw_text: str) -> Tuple[bool, Optional[Any], s
                 continue
             if not isinstance(val, dict):
                 continue
-            if not {"display_format", "explanation"}.issubset(val):
+            if not _DICT_ITEM_KEYS.issubset(val):
                 continue
             if not _english_heading_ok(val["display_format"], word):
                 continue
@@ -135,33 +153,22 @@ def validate_explanations_payload(raw_text: str) -> Tuple[bool, Optional[Any], s
         #     if len(with_notes) / len(content_keys) < 0.6:
         #         return False, None, "insufficient cultural notes"
 
-        return (len(cleaned_d) > 0), cleaned_d if cleaned_d else None, "partial_ok" if cleaned_d else "no valid items"
+        if cleaned_d:
+            return True, cleaned_d, "partial_ok"
+        return False, None, "no valid items"
 
     return False, None, "Unexpected JSON structure"
 
 
 # ---------------------------------------------------------------------------
-# Proper-noun coverage helpers (ported from v1)
+# Title coverage helpers (ported from v1)
 # ---------------------------------------------------------------------------
 
-_CAP_RE = re.compile(r"(?:[A-Z][\w'’.-]+(?:\s+[A-Z][\w'’.-]+){0,4})")
-
-def _merge_proper_nouns(title: str) -> str:
-    """Collapse multi-word proper names to preserve them as single tokens."""
-    def repl(match):
-        return match.group(0).replace(" ", " ")  # NBSP join to keep as one chunk
-
-    return _CAP_RE.sub(repl, title)
+# Words (incl. elided "l'Union"), numbers and the punctuation the LLM is asked to explain
+_TOKEN_RE = re.compile(r"\w+'\w+|\w+|[«»\":,.;?!]")
 
 def expected_tokens_from_title(title: str) -> set[str]:
-    text = _merge_proper_nouns(title)
-    tokens = set()
-    # Split on whitespace but keep punctuation tokens
-    for tok in re.findall(r"\w+'\w+|\w+|[«»\":,.;?!]", text):
-        tok = tok.replace(" ", " ")  # restore normal space
-        if tok:
-            tokens.add(tok)
-    return tokens
+    return set(_TOKEN_RE.findall(title))
 
 def coverage_ok(title: str, explanations: list[dict[str, str]] | dict, *, max_missing: int = 3, max_missing_ratio: float = 0.2) -> bool:
     """Return True if coverage is good enough.
@@ -19,6 +19,11 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Indicator vocabularies are fixed, so build them once at import instead of per article
+_LOCATION_INDICATORS = frozenset({'paris', 'lyon', 'marseille', 'france', 'french', 'français'})
+_URGENT_INDICATORS = frozenset({'urgent', 'breaking', 'emergency', 'alerte', 'immediate'})
+_TRUSTED_SOURCES = frozenset({'le figaro', 'le monde', 'liberation', 'bfm', 'france24', 'reuters'})
+
 @dataclass
 class Article:
     """Article with enhanced metadata for intelligent curation."""
@@ -74,6 +79,7 @@ class IntelligentCurator:
             'french': {'le', 'la', 'les', 'de', 'du', 'des', 'à', 'au', 'aux', 'et', 'ou', 'pour', 'avec', 'dans', 'sur', 'par'},
             'english': {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
         }
+        self._all_stop_words = frozenset(self.stop_words['french'] | self.stop_words['english'])
         
         # Topic keyword mappings (expandable)
         self.topic_keywords = {
@@ -183,13 +189,11 @@ class IntelligentCurator:
                     found_topics.append(main_topic)
         
         # Extract location-based topics
-        location_indicators = ['paris', 'lyon', 'marseille', 'france', 'french', 'français']
-        if any(loc in text_lower for loc in location_indicators):
+        if any(loc in text_lower for loc in _LOCATION_INDICATORS):
             found_topics.append('france_local')
         
         # Extract urgency indicators
-        urgent_indicators = ['urgent', 'breaking', 'emergency', 'alerte', 'immediate']
-        if any(urgent in text_lower for urgent in urgent_indicators):
+        if any(urgent in text_lower for urgent in _URGENT_INDICATORS):
             found_topics.append('urgent_news')
         
         return list(set(found_topics))  # Remove duplicates
@@ -243,10 +247,9 @@ class IntelligentCurator:
     
     def _score_source_quality(self, source: str) -> float:
         """Simple source quality scoring."""
-        trusted_sources = ['le figaro', 'le monde', 'liberation', 'bfm', 'france24', 'reuters']
         source_lower = source.lower()
         
-        if any(trusted in source_lower for trusted in trusted_sources):
+        if any(trusted in source_lower for trusted in _TRUSTED_SOURCES):
             return 1.0
         else:
             return 0.7  # Neutral for unknown sources
@@ -257,8 +260,7 @@ class IntelligentCurator:
         words = text.lower().split()
         
         # Remove stop words
-        all_stop_words = self.stop_words['french'] | self.stop_words['english']
-        meaningful_words = [w for w in words if w not in all_stop_words and len(w) > 2]
+        meaningful_words = [w for w in words if w not in self._all_stop_words and len(w) > 2]
         
         # Sort and join to create fingerprint
         fingerprint = ' '.join(sorted(meaningful_words[:10]))  # Top 10 meaningful words
@@ -300,7 +302,7 @@ class IntelligentCurator:
             if len(group) > 1:
                 # Multiple similar articles - select best quality
                 best_article = max(group_articles, key=lambda a: a.quality_score)
-                logger.info(f"📝 Duplicate group found: kept '{best_article.title[:40]}...', removed {len(group)-1} similar")
+                logger.info("📝 Duplicate group found: kept '%.40s...', removed %d similar", best_article.title, len(group) - 1)
             else:
                 # Single article, keep it
                 best_article = group_articles[0]
@@ -345,14 +347,16 @@ class IntelligentCurator:
         
         target_count = self.config['target_article_count']
         max_per_topic = self.config['max_articles_per_topic']
+        quality_weight = self.config['quality_weight']
+        novelty_weight = self.config['novelty_weight']
+        quality_threshold = self.config['quality_threshold']
         
         # Calculate combined scores
         for article in articles:
-            combined_score = (
-                self.config['quality_weight'] * article.quality_score +
-                self.config['novelty_weight'] * article.novelty_score
+            article.combined_score = (
+                quality_weight * article.quality_score +
+                novelty_weight * article.novelty_score
             )
-            article.combined_score = combined_score
         
         # Sort by combined score
         sorted_articles = sorted(articles, key=lambda a: a.combined_score, reverse=True)
@@ -373,14 +377,14 @@ class IntelligentCurator:
                     break
             
             # Select if constraints met and quality threshold passed
-            if can_select and article.quality_score >= self.config['quality_threshold']:
+            if can_select and article.quality_score >= quality_threshold:
                 selected.append(article)
                 
                 # Update topic usage
                 for topic in article.topics:
                     topic_usage[topic] = topic_usage.get(topic, 0) + 1
                 
-                logger.info(f"✅ Selected: '{article.title[:50]}...' (Q:{article.quality_score:.2f}, N:{article.novelty_score:.2f})")
+                logger.info("✅ Selected: '%.50s...' (Q:%.2f, N:%.2f)", article.title, article.quality_score, article.novelty_score)
         
         return selected
     
@@ -403,7 +407,7 @@ class IntelligentCurator:
         
         # Rejection analysis
         selected_links = {a.link for a in selected}
-        rejected_count = len([a for a in all_candidates if a.link not in selected_links])
+        quality_threshold = self.config['quality_threshold']
         
         # Simplified rejection reasons (for summary)
         rejection_reasons = {
@@ -412,10 +416,12 @@ class IntelligentCurator:
             'semantic_duplicate': 0
         }
         
-        # Estimate rejection reasons (simplified)
+        # Estimate rejection reasons (simplified) – the total is counted in the same pass
+        rejected_count = 0
         for article in all_candidates:
             if article.link not in selected_links:
-                if hasattr(article, 'quality_score') and article.quality_score < self.config['quality_threshold']:
+                rejected_count += 1
+                if hasattr(article, 'quality_score') and article.quality_score < quality_threshold:
                     rejection_reasons['quality_too_low'] += 1
                 else:
                     rejection_reasons['topic_oversaturation'] += 1
@@ -6,7 +6,6 @@ Contains API keys and external service configurations
 
 import os, sys
 from pathlib import Path
-from configparser import ConfigParser
 
 # ⚠️ SECURITY NOTE: This file contains sensitive API keys
 # - Never commit this file to public repositories
@@ -28,6 +27,8 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 if not OPENROUTER_API_KEY:
     cfg_path = Path(__file__).resolve().parent / "config.ini"
     if cfg_path.exists():
+        from configparser import ConfigParser  # only needed off-CI, where the env var is unset
+
         parser = ConfigParser()
         parser.read(cfg_path)
         OPENROUTER_API_KEY = parser.get("secrets", "OPENROUTER_API_KEY", fallback=None)
@@ -78,6 +79,9 @@ DEFAULT_HEADERS = {
 
 def setup_environment_variables():
     """Set up environment variables for API access"""
+    # Already exported (CI, child scripts, or a second import under another name)
+    if os.environ.get('OPENROUTER_API_KEY') == OPENROUTER_API_KEY:
+        return
     os.environ['OPENROUTER_API_KEY'] = OPENROUTER_API_KEY
     print("✅ OpenRouter API key configured in environment")
 
@@ -8,11 +8,12 @@ import os
 import sys
 import time
 import json
-import webbrowser
 import logging
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import http.server
-import socketserver
+from operator import attrgetter
 import threading
 import socket
 
@@ -25,17 +26,30 @@ sys.path.extend([scripts_dir, config_dir])
 # Set up API configuration first
 import api_config
 
-# Import system components using new AI-Engine filename
-from scripts.smart_scraper import SmartScraper
-from scripts.quality_curator import AutomatedCurator
-import importlib.util
-spec = importlib.util.spec_from_file_location("AI_Engine", os.path.join(scripts_dir, "AI-Engine.py"))
-AI_Engine = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(AI_Engine)
-CostOptimizedAIProcessor = AI_Engine.CostOptimizedAIProcessor
-from scripts.website_updater import LiveWebsiteUpdater
-from config.automation import AUTOMATION_CONFIG, AI_PROCESSING_CONFIG
-from scripts.monitoring import SystemMonitor
+# Pipeline components are imported inside the steps that use them, so the menu
+# (and the Exit choice) comes up without loading the whole pipeline.
+
+@functools.cache
+def _load_ai_engine():
+    """Load scripts/AI-Engine.py (hyphenated filename) once."""
+    spec = importlib.util.spec_from_file_location("AI_Engine", os.path.join(scripts_dir, "AI-Engine.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Fields handed from the curator to the AI processor, and from the processor to the website
+_AI_INPUT_FIELDS = (
+    'original_data', 'quality_score', 'relevance_score', 'importance_score',
+    'total_score', 'curation_id', 'curated_at', 'fast_tracked',
+)
+_WEBSITE_FIELDS = (
+    'original_article_title', 'original_article_link', 'original_article_published_date',
+    'simplified_french_title', 'simplified_english_title', 'french_summary', 'english_summary',
+    'contextual_title_explanations', 'key_vocabulary', 'cultural_context', 'source_name',
+    'quality_scores', 'curation_metadata', 'processing_id', 'processed_at',
+)
+_ai_input = attrgetter(*_AI_INPUT_FIELDS)
+_website_fields = attrgetter(*_WEBSITE_FIELDS)
 
 # --- Web Server Management ---
 PORT = 8007
@@ -54,6 +68,9 @@ def start_server():
         web_dir = os.path.join(os.path.dirname(__file__), 'Project-Better-French-Website')
         os.chdir(web_dir)
         
+        import http.server
+        import socketserver
+
         Handler = http.server.SimpleHTTPRequestHandler
         httpd = socketserver.TCPServer(("", PORT), Handler)
         
@@ -69,6 +86,8 @@ def start_server():
 def open_browser():
     """Open the web browser to the server's address."""
     if SERVER_RUNNING:
+        import webbrowser
+
         webbrowser.open_new(f"http://localhost:{PORT}")
         print("✅ Opening website in your default browser...")
 
@@ -88,6 +107,12 @@ class BetterFrenchMaxDemo:
         print("\n📦 Step 1: Initializing Automation Components...")
         
         try:
+            from scripts.smart_scraper import SmartScraper
+            from scripts.quality_curator import AutomatedCurator
+            from scripts.website_updater import LiveWebsiteUpdater
+            from scripts.monitoring import SystemMonitor
+            CostOptimizedAIProcessor = _load_ai_engine().CostOptimizedAIProcessor
+
             self.components['scraper'] = SmartScraper()
             print("   ✅ Smart Scraper ready")
             
@@ -115,31 +140,34 @@ class BetterFrenchMaxDemo:
         
         scraper = self.components['scraper']
         
-        # Quick breaking news scan
+        # The three fetches are network-bound and the scraper is thread-safe (it runs
+        # its own feeds in a pool), so wall time is the slowest one, not the sum
         print("   🔥 Scanning for breaking news...")
-        breaking_articles = scraper.quick_breaking_news_scan([])
-        
-        # Get some recent articles from top sources  
         print("   📺 Getting recent articles from France Info...")
-        france_info_articles = scraper.scrape_single_feed("France Info", scraper.feed_urls["France Info"])
-        
         print("   📰 Getting recent articles from Le Monde...")
-        le_monde_articles = scraper.scrape_single_feed("Le Monde", scraper.feed_urls["Le Monde"])
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            breaking_future = executor.submit(scraper.quick_breaking_news_scan, [])
+            france_info_future = executor.submit(
+                scraper.scrape_single_feed, "France Info", scraper.feed_urls["France Info"]
+            )
+            le_monde_future = executor.submit(
+                scraper.scrape_single_feed, "Le Monde", scraper.feed_urls["Le Monde"]
+            )
+            breaking_articles = breaking_future.result()
+            france_info_articles = france_info_future.result()
+            le_monde_articles = le_monde_future.result()
         
         # Combine all articles
         all_articles = breaking_articles + france_info_articles + le_monde_articles
         
-        # Remove duplicates by title
-        unique_articles = []
-        seen_titles = set()
+        # Remove duplicates by title (first occurrence wins; casefold also matches ß/ss, Œ/œ)
+        by_title = {}
         for article in all_articles:
-            title = article.title.lower()
-            if title not in seen_titles:
-                unique_articles.append(article)
-                seen_titles.add(title)
+            by_title.setdefault(article.title.casefold(), article)
+        unique_articles = list(by_title.values())
         
         self.results['scraped_articles'] = unique_articles
-        self.results['breaking_count'] = len([a for a in unique_articles if a.breaking_news])
+        self.results['breaking_count'] = sum(1 for a in unique_articles if a.breaking_news)
         
         print(f"   📊 Total articles scraped: {len(unique_articles)}")
         print(f"   🚨 Breaking news articles: {self.results['breaking_count']}")
@@ -196,51 +224,23 @@ class BetterFrenchMaxDemo:
         print(f"   🎯 Processing top {len(demo_articles)} articles with AI...")
         
         try:
-            # Check if we have API key
-            if not os.getenv('OPENROUTER_API_KEY'):
+            # The processor resolved the key (env or config.ini) once at construction
+            if not ai_processor.api_key:
                 print("   ❌ CRITICAL: OPENROUTER_API_KEY is not set.")
                 print("   Please set the environment variable to enable AI processing.")
                 raise ValueError("API key for AI processing is missing.")
 
             # Convert ScoredArticle objects to format expected by AI processor
-            ai_candidates = []
-            for scored_article in demo_articles:
-                article_for_ai = {
-                    'original_data': scored_article.original_data,
-                    'quality_score': scored_article.quality_score,
-                    'relevance_score': scored_article.relevance_score,
-                    'importance_score': scored_article.importance_score,
-                    'total_score': scored_article.total_score,
-                    'curation_id': scored_article.curation_id,
-                    'curated_at': scored_article.curated_at,
-                    'fast_tracked': scored_article.fast_tracked
-                }
-                ai_candidates.append(article_for_ai)
+            ai_candidates = [dict(zip(_AI_INPUT_FIELDS, _ai_input(a))) for a in demo_articles]
             
             # Real AI processing
             processed_articles = ai_processor.batch_process_articles(ai_candidates)
             
             # Convert to dict format for website
-            processed_dicts = []
-            for article in processed_articles:
-                processed_dicts.append({
-                    'original_article_title': article.original_article_title,
-                    'original_article_link': article.original_article_link,
-                    'original_article_published_date': article.original_article_published_date,
-                    'simplified_french_title': article.simplified_french_title,
-                    'simplified_english_title': article.simplified_english_title,
-                    'french_summary': article.french_summary,
-                    'english_summary': article.english_summary,
-                    'contextual_title_explanations': article.contextual_title_explanations,
-                    'key_vocabulary': article.key_vocabulary,
-                    'cultural_context': article.cultural_context,
-                    'source_name': article.source_name,
-                    'quality_scores': article.quality_scores,
-                    'curation_metadata': article.curation_metadata,
-                    'ai_enhanced': True,
-                    'processing_id': article.processing_id,
-                    'processed_at': article.processed_at
-                })
+            processed_dicts = [
+                {**dict(zip(_WEBSITE_FIELDS, _website_fields(a))), 'ai_enhanced': True}
+                for a in processed_articles
+            ]
             
             self.results['ai_processed_articles'] = processed_dicts
             print(f"   ✨ AI processing completed: {len(processed_articles)} articles")
@@ -326,6 +326,7 @@ class BetterFrenchMaxDemo:
         print(f"   🤖 AI Enhanced: {self.results.get('ai_processed_articles_count', 0)}")
         print(f"   💚 System Status: {self.results.get('system_status', 'unknown')}")
         print(f"   ⏱️ Total Time: {self.results.get('demo_duration', 0):.2f} seconds")
+        from config.automation import AI_PROCESSING_CONFIG
         print(f"   💰 Cost Efficiency: Processing only top {AI_PROCESSING_CONFIG['quality_threshold_for_ai']} articles (vs ~200 in manual system)")
 
         print("\n🌐 Live Website Ready!")
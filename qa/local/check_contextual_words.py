@@ -7,9 +7,14 @@ the items are missing contextual data, so CI can fail.
 """
 from __future__ import annotations
 
-import argparse, json, pathlib, sys, urllib.request, urllib.error
+import argparse, json, pathlib, re, sys, urllib.request, urllib.error
 from datetime import datetime
 
+try:
+    import orjson  # optional – the rolling feed is several MB
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 # Reuse validator helper for coverage measure
 from ai_engine_v2.validator import coverage_ok
 
@@ -19,6 +24,20 @@ DEFAULT_PATH = (
     / "rolling_articles.json"
 )
 
+# Tooltips are only checked on articles processed after the heading fix
+LEGACY_CUTOFF = datetime(2025, 6, 23)
+_HEADING_RE = re.compile(r"\*\*([^:]+):")
+_ACCENTED_RE = re.compile(r"[À-ÿ]")
+
+
+def _heading_is_french(display_fmt: str, original: str) -> bool:
+    m = _HEADING_RE.match(display_fmt or "")
+    if not m:
+        return True
+    heading = m.group(1).strip()
+    # accented letter or identical to original token
+    return heading.lower() == original.lower() or bool(_ACCENTED_RE.search(heading))
+
 
 def main():
     parser = argparse.ArgumentParser(description="Check contextual explanations in rolling feed")
@@ -54,7 +73,8 @@ def main():
         if not args.path.exists():
             print(f"❌ File not found: {args.path}")
             sys.exit(1)
-        data = json.loads(args.path.read_text(encoding="utf-8"))
+        raw = args.path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     articles = data.get("articles", [])
     total = len(articles)
@@ -103,21 +123,11 @@ def main():
         # ---------- new heading quality check (only for fresh articles) ----------
         proc_ds = art.get("processed_at") or art.get("processing_date")
         legacy = False
-        dt_cut = datetime(2025, 6, 23)
         if proc_ds:
             ts = _parse_date(proc_ds)
-            if ts and ts < dt_cut:
+            if ts and ts < LEGACY_CUTOFF:
                 legacy = True
 
-        def _heading_is_french(display_fmt: str, original: str) -> bool:
-            import re
-            m = re.match(r"\*\*([^:]+):", display_fmt or "")
-            if not m:
-                return True
-            heading = m.group(1).strip()
-            # accented letter or identical to original token
-            return heading.lower() == original.lower() or bool(re.search(r"[À-ÿ]", heading))
-
         if not legacy:
             items = ctxt.values() if isinstance(ctxt, dict) else ctxt
             for item in items:
@@ -10,10 +10,12 @@ import sys
 import json
 import time
 import logging
+import functools
 import requests
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
+from collections import deque
 import re
 # spaCy NER for robust name detection
 try:
@@ -42,6 +44,294 @@ except ModuleNotFoundError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Only the most recent failures are kept for the daily stats report
+MAX_FAILED_ARTICLES_LOGGED = 50
+
+# Seconds to wait for an OpenRouter completion
+LLM_REQUEST_TIMEOUT = 30
+
+# Static prompt pieces, shared by every article (only the title/summary vary)
+_TITLE_PROMPT_HEAD = (
+    "You are Better French assistant. Return ONLY a VALID JSON object exactly matching this schema:\n"
+    '{\n'
+    '  "simplified_french_title": "",\n'
+    '  "simplified_english_title": "",\n'
+    '  "french_summary": "",\n'
+    '  "english_summary": ""\n'
+    '}\n'
+    "DO NOT add any other keys or explanatory text.\n\n"
+    "Key requirements:\n"
+    "  • simplified_french_title – concise French ≤ 60 chars, keep speaker & scope.\n"
+    "  • simplified_english_title – faithful English translation ≤ 60 chars.\n"
+    "  • french_summary – simple French, 30-40 words – count them.\n"
+    "  • english_summary – clear English, 30-40 words – count them.\n"
+    "Rules for titles: preserve actors/places/actions, drop click-bait prefixes, maintain tense.\n\n"
+)
+
+_EXPLANATION_SCHEMA = '[\n  {\n    "original_word": "",\n    "display_format": "",\n    "explanation": "",\n    "cultural_note": "",\n    "part_of_speech": "",\n    "cefr": "",\n    "example": ""\n  }\n]'
+
+_NAME_RULE = (
+    "IMPORTANT : treat a person's full name (all consecutive capitalised words, including hyphens, apostrophes or middle initials) as **one** original_word."
+)
+
+_NAME_EXAMPLES = """
+EX 1 — simple two-word name
+Title: "Donald Trump promet un accord"
+contextual_title_explanations: [ {"original_word": "Donald Trump" , "display_format": "**Donald Trump:** 45e président des États-Unis", "explanation": "American politician and businessman."} ]
+
+EX 2 — hyphenated name
+Title: "Jean-Luc Mélenchon critique le budget"
+contextual_title_explanations: [ {"original_word": "Jean-Luc Mélenchon", "display_format": "**Jean-Luc Mélenchon:** Chef du parti LFI", "explanation": "French left-wing political leader."} ]
+
+EX 3 — accented first name
+Title: "Nicolás Maduro annonce des réformes"
+contextual_title_explanations: [ {"original_word": "Nicolás Maduro", "display_format": "**Nicolás Maduro:** Président du Venezuela", "explanation": "Venezuelan head of state."} ]
+
+EX 4 — apostrophe contraction (capital)
+Title: "L'Iran répond aux sanctions"
+contextual_title_explanations: [ {"original_word": "L'Iran", "display_format": "**L'Iran:** Pays du Moyen-Orient", "explanation": "Middle-Eastern country."} ]
+
+EX 5 — apostrophe contraction (lower-case)
+Title: "d'Europe vient une nouvelle directive"
+contextual_title_explanations: [ {"original_word": "d'Europe", "display_format": "**d'Europe:** De l'Europe", "explanation": "Refers to Europe as origin."} ]
+
+EX 6 — place name with accent + hyphen
+Title: "Sécheresse en Île-de-France cet été"
+contextual_title_explanations: [ {"original_word": "Île-de-France", "display_format": "**Île-de-France:** Région de Paris", "explanation": "Region surrounding Paris."} ]
+
+EX 7 — multi-word proper noun with digits
+Title: "Les Jeux Olympiques 2024 approchent"
+contextual_title_explanations: [ {"original_word": "Jeux Olympiques 2024", "display_format": "**Jeux Olympiques 2024:** Événement sportif mondial", "explanation": "2024 Summer Olympic Games."} ]
+
+EX 8 — punctuation token example
+Title: "« Liberté » : un mot chargé d'histoire"
+contextual_title_explanations: [ {"original_word": "«", "display_format": "**«:** Guillemets ouvrants", "explanation": "Opening French quotation mark."}, {"original_word": "Liberté", "display_format": "**Liberté:** Freedom", "explanation": "Abstract noun meaning freedom."}, {"original_word": "»", "display_format": "**»:** Guillemets fermants", "explanation": "Closing French quotation mark."}, {"original_word": ":", "display_format": "**:** Deux-points", "explanation": "Colon introducing an explanation."} ]
+"""
+
+# Title/summary examples and output requirements of the single-call prompt
+_SIMPLIFIED_EXAMPLES = """
+TITLE EXAMPLE
+Original Title: Inflation : les prix alimentaires vont-ils enfin baisser ?
+"simplified_french_title": "Inflation : les prix alimentaires vont-ils enfin baisser ?"  # 57 chars
+"simplified_english_title": "Inflation: Will food prices finally fall?"  # 48 chars
+
+SUMMARY EXAMPLE 1 (FR & EN, 34 / 35 words)
+"french_summary": "La nouvelle loi climat oblige les grandes entreprises à publier chaque année un bilan carbone détaillé. Des ONG saluent un pas majeur, mais avertissent que des contrôles sérieux seront essentiels pour éviter le greenwashing."
+"english_summary": "A new climate law forces large companies to publish an annual, detailed carbon report. NGOs welcome the major step yet warn that strong enforcement is crucial to stop firms from green-washing their public image."
+
+SUMMARY EXAMPLE 2 (32 / 33 words)
+"french_summary": "Après deux semaines de grève, la SNCF accepte une hausse salariale de 4 %. Les syndicats considèrent l'accord comme une première victoire et suspendent le mouvement pour laisser place aux négociations sectorielles."
+"english_summary": "After two weeks of strikes, French Railways agreed to a 4 % pay rise. Unions call the deal an initial victory and pause the stoppage, opening room for detailed talks in each job category."
+
+SUMMARY EXAMPLE 3 (37 / 36 words)
+"french_summary": "Le Parlement européen interdit dès 2035 la vente de voitures diesel et essence neuves. Les constructeurs saluent une visibilité claire, mais s'inquiètent du retard des bornes de recharge dans plusieurs États membres."
+"english_summary": "The European Parliament has banned sales of new petrol and diesel cars from 2035. Carmakers welcome the clear timeline yet worry many member states still lag in building a dense fast-charging network."
+
+SUMMARY EXAMPLE 4 (31 / 32 words)
+"french_summary": "Un séisme de magnitude 6,2 a frappé le sud du Chili sans faire de victime grave. Les autorités rappellent cependant l'importance de renforcer les bâtiments anciens situés dans les zones sismiques."
+"english_summary": "A 6.2-magnitude earthquake shook southern Chile causing no serious casualties. Officials nevertheless stress the urgent need to reinforce older buildings that sit in the country's high-risk seismic corridor."
+
+SUMMARY EXAMPLE 5 (35 / 34 words)
+"french_summary": "La finale de Roland-Garros se jouera finalement sous le toit fermé à cause d'orages annoncés. Les organisateurs assurent que cette décision garantit la sécurité du public tout en préservant la qualité du jeu."
+"english_summary": "The French Open final will be played under the closed roof because thunderstorms are forecast. Organisers say the move protects spectators' safety while ensuring consistent playing conditions for the athletes."
+"""
+
+_FULL_PROMPT_REQUIREMENTS = """
+Provide your response as a VALID JSON object with these exact keys:
+
+{
+  "simplified_french_title": "[Create a simplified French version of the title, removing complex phrases while keeping the meaning]",
+  "simplified_english_title": "[Create a clear English translation of the title]", 
+  "french_summary": "[Create a simple French summary in exactly 20-25 words using basic vocabulary]",
+  "english_summary": "[Create a clear English summary in exactly 20-25 words]",
+  "contextual_title_explanations": [
+    {
+      "original_word": "[exact word/phrase from title]",
+      "display_format": "**[Word]:** [Brief translation]",
+      "explanation": "[Detailed explanation in English]",
+      "cultural_note": "[Cultural context if relevant: historical significance, political context, French cultural aspects, or current events connection. Empty string if not applicable]",
+      "part_of_speech": "[Part of speech of the word]",
+      "cefr": "[CEFR level of the word]",
+      "example": "[One short sentence, max 10 words, showing the word in context]"
+    }
+  ]
+}
+
+CRITICAL REQUIREMENTS:
+- Only return the JSON object, no other text
+- Make simplified titles clear and accessible  
+- Simplified titles must be ≤ 60 characters, keep all key actors/action/place, remove click-bait prefixes and quotes, keep original tense.
+- If the original headline names a speaker or source (text before the first colon or within quotes), retain that attribution in the simplified titles.
+- Preserve important scope words such as "régional", "mondial", etc.
+- YOU MUST provide contextual explanations for EVERY SINGLE WORD AND PHRASE in the title - NO EXCEPTIONS
+- This includes: articles (le, la, une), prepositions (de, à, dans, pour), conjunctions (et, que, ou), pronouns (ce, l', on), basic verbs (est, sait), and ALL other words
+- EVERY word helps language learners understand grammar patterns and build vocabulary
+- When a proper noun consists of multiple capitalised words (e.g., "Donald Trump", "David A. Bell"), treat the entire name as **one** original_word and provide one combined explanation – do NOT split names into separate words
+- Even if a word seems "basic", it must be explained for learners at different proficiency levels
+- Punctuation **also** needs context: include brief usage notes for any punctuation marks appearing in the title (e.g., ":" colon introduces a clause, "," comma separates elements, "?" indicates a question) – double-check that commas, colons, slashes, hyphens, and question marks are not skipped.
+- FULL PUNCTUATION WHITELIST: you must add an entry for **each** occurrence of these characters if they appear in the title → . , ; : ! ? … — - / ( ) « » " ' ’
+- COVERAGE CHECK: If the number of objects in "contextual_title_explanations" is **not exactly equal** to the number of tokens (INCLUDING punctuation) in the original title, you must instead reply with ONLY the single word **ERROR**.
+- For **every** original_word you must add three extra teaching fields inside its JSON object:
+   • "part_of_speech"  (noun, verb, adj., etc.)
+   • "cefr"  (A1, A2, B1, B2, C1, C2)
+   • "example"  (ONE short sentence, max 10 words, showing the word in context)
+- Do NOT skip any words - complete coverage is mandatory
+- Ensure all French text uses proper accents and grammar
+- Hyphenated or slash-separated compounds (e.g., "Seine-Saint-Denis", "top/flop", "13/06") must be treated as **one** original_word – do NOT split on the hyphen or slash.
+- Contractions that use an apostrophe (straight ' or curly ’) such as "L'Iran", "n'est", "l'inauguration" must likewise be **one** original_word.
+- When punctuation appears *inside* such a compound/contraction, do **not** create a separate entry for that punctuation – the context belongs to the full word.
+
+Based on the article above, provide the complete JSON response:
+"""
+
+@functools.cache
+def _few_shot_examples(num_examples: int = 2) -> str:
+    """Get comprehensive few-shot examples from the proven original system
+
+    The text never changes, so it is built once per process and every prompt
+    starts with the same bytes (provider-side prefix caching can then reuse it).
+    """
+    # COMPLETE pre_designed_data from the original proven system
+    pre_designed_data = {
+        "Droits de douane : ces options sur la table de Donald Trump après son revers judiciaire": {
+            "contextual_title_explanations": {
+                "Droits de douane": {"display_format": "**Customs Duties / Tariffs:** Taxes on imported goods.", "explanation": "Taxes imposed on goods when they are transported across international borders. Governments usually impose customs duties to protect domestic industries, generate revenue, or regulate the flow of goods.", "cultural_note": "Trade tariffs are a significant tool in international economic policy and can become major points of contention between countries, as seen in various trade disputes involving the US, China, and the EU.", "proficiency_level": "B2"},
+                "ces": {"display_format": "**These:** (demonstrative adjective)", "explanation": "Used to point out specific items or options being discussed.", "cultural_note": "", "proficiency_level": "A1"},
+                "options": {"display_format": "**Options:** Choices or alternatives.", "explanation": "Different courses of action that can be chosen.", "cultural_note": "", "proficiency_level": "A2"},
+                "sur la table": {"display_format": "**On the table:** Under consideration; being discussed or negotiated.", "explanation": "An idiomatic expression meaning that something is available for discussion or is a possibility.", "cultural_note": "Similar to the English idiom 'on the table.'", "proficiency_level": "B1"},
+                "de": {"display_format": "**Of / From:** (preposition)", "explanation": "Indicates possession, origin, or relationship.", "cultural_note": "", "proficiency_level": "A1"},
+                "Donald Trump": {"display_format": "**Donald Trump:** 45th President of the United States.", "explanation": "A prominent American political figure and businessman.", "cultural_note": "His presidency was marked by significant changes to US trade policy, including the imposition of tariffs on goods from various countries.", "proficiency_level": "C1"},
+                "après": {"display_format": "**After:** (preposition)", "explanation": "Indicates something that follows in time.", "cultural_note": "", "proficiency_level": "A1"},
+                "son": {"display_format": "**His / Her / Its:** (possessive adjective)", "explanation": "Indicates possession.", "cultural_note": "", "proficiency_level": "A1"},
+                "revers judiciaire": {"display_format": "**Legal setback / Judicial defeat:** A loss or unfavorable outcome in a court case.", "explanation": "Refers to a situation where a legal case or argument has not been successful.", "cultural_note": "Such setbacks can force a re-evaluation of strategy, as discussed in the article regarding Trump's tariff policies.", "proficiency_level": "B2"}
+            }
+        },
+        "EXCLUSIF. Des cadres des Verts plaident pour adhérer à BDS, mouvement controversé de boycott d'Israël": {
+            "contextual_title_explanations": [
+                {"original_word": "EXCLUSIF", "display_format": "**EXCLUSIVE:** (adjective/noun)", "explanation": "Indicates that the information is being reported for the first time by this news outlet.", "cultural_note": "Commonly used in headlines to attract attention."},
+                {"original_word": "Des cadres", "display_format": "**Executives / Leading members / Cadres:** Senior or influential members of an organization.", "explanation": "'Cadre' refers to a manager, executive, or a key member of a political party or organization.", "cultural_note": "In French politics, 'cadres' are the backbone of a party's leadership and decision-making structure."},
+                {"original_word": "des Verts", "display_format": "**Of the Greens (French Green Party):** Refers to the French political party focused on environmental issues (Europe Écologie Les Verts - EELV).", "explanation": "'Les Verts' is the common name for the French Green Party.", "cultural_note": "Like Green parties in other countries, they advocate for ecological policies and often align with left-leaning social stances."},
+                {"original_word": "plaident pour", "display_format": "**Advocate for / Argue in favor of:** To publicly support or recommend a particular cause or policy.", "explanation": "'Plaider' means to plead or argue a case.", "cultural_note": ""},
+                {"original_word": "adhérer à", "display_format": "**To join / To adhere to:** To become a member of or to formally agree to support.", "explanation": "'Adhérer' means to stick to, or in a political context, to join or subscribe to a movement or party.", "cultural_note": ""},
+                {"original_word": "BDS", "display_format": "**BDS (Boycott, Divestment, Sanctions):** A Palestinian-led movement promoting boycotts, divestments, and economic sanctions against Israel.", "explanation": "The movement aims to pressure Israel to meet what it describes as Israel's obligations under international law.", "cultural_note": "BDS is a highly controversial movement, with strong opinions both for and against its methods and goals. Its potential adoption by political parties often sparks significant debate."},
+                {"original_word": "mouvement", "display_format": "**Movement:** A group of people working together to advance their shared political, social, or artistic ideas.", "explanation": "Refers to an organized effort or campaign.", "cultural_note": ""},
+                {"original_word": "controversé", "display_format": "**Controversial:** Giving rise or likely to give rise to public disagreement.", "explanation": "Indicates that the subject is a matter of dispute or strong opinions.", "cultural_note": ""},
+                {"original_word": "de boycott", "display_format": "**Of boycott:** Relating to the act of boycotting.", "explanation": "A boycott is a collective refusal to deal with a person, organization, or country as an expression of protest.", "cultural_note": ""},
+                {"original_word": "d'Israël", "display_format": "**Of Israel:** Relating to the state of Israel.", "explanation": "Referring to the country in the Middle East.", "cultural_note": ""}
+            ]
+        },
+        "Présidentielle en Pologne : l'élection qui donne des sueurs froides à Bruxelles": {
+            "contextual_title_explanations": [
+                {"original_word": "Présidentielle", "display_format": "**Presidential (election):** Relating to the election of a president.", "explanation": "Refers to the process of electing a head of state in a republic.", "cultural_note": ""},
+                {"original_word": "en Pologne", "display_format": "**In Poland:** Referring to the country of Poland.", "explanation": "A country in Central Europe.", "cultural_note": "Poland's political direction has significant implications for the European Union, given its size and strategic location."},
+                {"original_word": "l'élection", "display_format": "**The election:** The process of choosing someone for a public office by voting.", "explanation": "A formal and organized choice by vote of a person for a political office or other position.", "cultural_note": ""},
+                {"original_word": "qui donne des sueurs froides", "display_format": "**Which is causing cold sweats / Causing great anxiety:** An idiomatic expression.", "explanation": "Literally 'gives cold sweats,' it means something that causes extreme worry, fear, or anxiety.", "cultural_note": "A common French idiom to express strong apprehension."},
+                {"original_word": "à Bruxelles", "display_format": "**To Brussels (referring to the EU):** Brussels is the de facto capital of the European Union.", "explanation": "When French media mentions 'Bruxelles' in a political context, it often refers to the institutions and decision-making bodies of the European Union.", "cultural_note": "Similar to how 'Washington' is often used to refer to the US federal government."}
+            ]
+        },
+        "Droits de douane : ces cinq petites entreprises qui ont mis un frein à la machine Trump": {
+            "contextual_title_explanations": [
+                {"original_word": "Droits de douane", "display_format": "**Customs Duties / Tariffs:** Taxes on imported goods.", "explanation": "Taxes imposed on goods when they are transported across international borders.", "cultural_note": "A recurring theme in trade policy discussions."},
+                {"original_word": "ces cinq petites entreprises", "display_format": "**These five small businesses:** Referring to specific small companies.", "explanation": "'Petites entreprises' are small to medium-sized enterprises (SMEs), often called PME in French.", "cultural_note": "Small businesses are often portrayed as being particularly vulnerable to broad economic policy shifts like tariffs."},
+                {"original_word": "qui ont mis un frein à", "display_format": "**That put a brake on / That slowed down:** An idiomatic expression.", "explanation": "Means to slow down or hinder the progress of something.", "cultural_note": "Similar to the English idiom 'put the brakes on.'"},
+                {"original_word": "la machine Trump", "display_format": "**The Trump machine:** Refers to the administrative and political apparatus of Donald Trump's presidency.", "explanation": "A metaphorical way to describe the functioning and policies of his government.", "cultural_note": "The term 'machine' often implies a powerful, relentless, and somewhat impersonal force."}
+            ]
+        },
+        "Etats-Unis : la Cour d'appel maintient les droits de douane de Donald Trump": {
+            "contextual_title_explanations": [
+                {"original_word": "Etats-Unis", "display_format": "**United States:** Referring to the United States of America.", "explanation": "Country in North America.", "cultural_note": ""},
+                {"original_word": "la Cour d'appel", "display_format": "**The Court of Appeal / Appeals Court:** A court that hears appeals from lower court decisions.", "explanation": "A higher court that reviews the decisions of trial courts or other lower courts.", "cultural_note": "An essential part of the judicial process, allowing for review and potential correction of legal errors."},
+                {"original_word": "maintient", "display_format": "**Maintains / Upholds:** To keep in an existing state; to preserve from failure or decline.", "explanation": "In a legal context, it means to affirm or keep a previous decision or state of affairs in place.", "cultural_note": ""},
+                {"original_word": "les droits de douane", "display_format": "**The customs duties / The tariffs:** Taxes on imported goods.", "explanation": "Taxes imposed on goods when they are transported across international borders.", "cultural_note": ""},
+                {"original_word": "de Donald Trump", "display_format": "**Of Donald Trump:** Belonging to or enacted by Donald Trump.", "explanation": "Refers to policies associated with his presidency.", "cultural_note": ""}
+            ]
+        },
+        "Guerre à Gaza : Benyamin Netanyahou, le grand divorce avec les Israéliens": {
+            "contextual_title_explanations": [
+                {"original_word": "Guerre à Gaza", "display_format": "**War in Gaza:**", "explanation": "Refers to the conflict in the Gaza Strip.", "cultural_note": "Long-standing conflict with global repercussions."},
+                {"original_word": "Benyamin Netanyahou", "display_format": "**Benjamin Netanyahu:**", "explanation": "Prime Minister of Israel.", "cultural_note": "A polarizing political figure."},
+                {"original_word": "le grand divorce", "display_format": "**The great divorce:**", "explanation": "Metaphor for a major split or estrangement.", "cultural_note": "Often used to describe political rifts."},
+                {"original_word": "avec les Israéliens", "display_format": "**With the Israelis:**", "explanation": "Refers to the people of Israel.", "cultural_note": ""}
+            ]
+        },
+        "PS : les députés de Seine-Saint-Denis boycotteront l'inauguration": {
+            "contextual_title_explanations": [
+                {"original_word": "PS", "display_format": "**PS (Parti socialiste):**", "explanation": "French Socialist Party.", "cultural_note": "A major centre-left political party in France."},
+                {"original_word": ":", "display_format": "**Colon:**", "explanation": "Introduces an explanation.", "cultural_note": ""},
+                {"original_word": "les", "display_format": "**The:** (article)", "explanation": "Definite article used before plural nouns.", "cultural_note": ""},
+                {"original_word": "députés", "display_format": "**Deputies:**", "explanation": "Members of the National Assembly.", "cultural_note": "French parliamentarians."},
+                {"original_word": "de", "display_format": "**Of / from:**", "explanation": "Preposition indicating origin or possession.", "cultural_note": ""},
+                {"original_word": "Seine-Saint-Denis", "display_format": "**Seine-Saint-Denis:**", "explanation": "A department north of Paris.", "cultural_note": "Often referenced in socio-economic discussions."},
+                {"original_word": "boycotteront", "display_format": "**Will boycott:**", "explanation": "Future tense of 'boycotter'.", "cultural_note": ""},
+                {"original_word": "l'inauguration", "display_format": "**The inauguration:**", "explanation": "Official opening event.", "cultural_note": "Contraction kept as one token as required."}
+            ]
+        },
+        "Face à la Chine, l'Europe en quête d'une nouvelle stratégie industrielle": {
+            "contextual_title_explanations": [
+                {"original_word": "Face à la Chine", "display_format": "**Facing China / In response to China:** Indicates a reaction or positioning relative to China.", "explanation": "Highlights the challenges or competition posed by China.", "cultural_note": "China's rise as a global economic power is a central theme in international relations and economic policy discussions in Europe."},
+                {"original_word": "l'Europe", "display_format": "**Europe (often referring to the EU):** The continent, but in policy contexts, usually means the European Union.", "explanation": "The European Union as a political and economic entity.", "cultural_note": ""},
+                {"original_word": "en quête d'une", "display_format": "**In search of a / Seeking a:** Looking for or trying to find something.", "explanation": "", "cultural_note": ""},
+                {"original_word": "nouvelle stratégie industrielle", "display_format": "**New industrial strategy:** A revised plan concerning a country's or region's manufacturing and industrial sectors.", "explanation": "Refers to policies aimed at promoting industrial growth, innovation, and competitiveness.", "cultural_note": "Industrial strategy is a key area of EU policy as it seeks to maintain its economic standing."}
+            ]
+        },
+        "IA générative : pourquoi la France est en train de perdre la bataille face aux Etats-Unis": {
+            "contextual_title_explanations": [
+                {"original_word": "IA générative", "display_format": "**Generative AI:** Artificial Intelligence that can create new content.", "explanation": "A subset of AI that can generate text, images, audio, and other media in response to prompts.", "cultural_note": "A rapidly advancing field with significant economic and societal implications, dominated by major US tech companies but with active research and development globally."},
+                {"original_word": "pourquoi la France est en train de perdre la bataille", "display_format": "**Why France is losing the battle:** Explores the reasons behind France's perceived disadvantage.", "explanation": "Suggests a competitive struggle where France is not succeeding.", "cultural_note": "There's often a public debate in France about its technological competitiveness, particularly vis-à-vis the US and China."},
+                {"original_word": "face aux Etats-Unis", "display_format": "**Against the United States / Compared to the United States:** Highlighting the US as the primary competitor or benchmark.", "explanation": "", "cultural_note": ""}
+            ]
+        },
+        "Réforme des retraites : le gouvernement face au mur de la dette": {
+            "contextual_title_explanations": [
+                {"original_word": "Réforme des retraites", "display_format": "**Pension Reform:** Changes to the national retirement system.", "explanation": "Refers to government policies aimed at modifying how pensions are funded, calculated, and when people can retire.", "cultural_note": "Pension reform is a highly sensitive and frequently debated political issue in France, often leading to widespread protests and strikes."},
+                {"original_word": "le gouvernement", "display_format": "**The government:** The ruling administration.", "explanation": "The executive branch of the French state.", "cultural_note": ""},
+                {"original_word": "face au mur de la dette", "display_format": "**Facing the debt wall:** Confronting a significant and challenging level of national debt.", "explanation": "The 'wall' metaphor emphasizes the difficulty and scale of the problem.", "cultural_note": "France, like many developed countries, has a substantial national debt, and its management is a constant concern for policymakers."}
+            ]
+        },
+        "Inflation : les prix alimentaires vont-ils enfin baisser ?": {
+            "contextual_title_explanations": [
+                {"original_word": "Inflation", "display_format": "**Inflation:** The rate at which the general level of prices for goods and services is rising.", "explanation": "A key economic indicator reflecting the erosion of purchasing power.", "cultural_note": "High inflation, especially for essential goods like food, is a major concern for the public and policymakers."},
+                {"original_word": "les prix alimentaires", "display_format": "**Food prices:** The cost of food items.", "explanation": "", "cultural_note": ""},
+                {"original_word": "vont-ils enfin baisser ?", "display_format": "**Will they finally decrease? / Are they finally going to go down?:** Expresses a sense of anticipation or hope for a reduction.", "explanation": "The word 'enfin' (finally) suggests a period of waiting or suffering high prices.", "cultural_note": ""}
+            ]
+        },
+        "Climat : la France peut-elle atteindre ses objectifs de réduction d'émissions ?": {
+            "contextual_title_explanations": [
+                {"original_word": "Climat", "display_format": "**Climate:** Referring to climate change.", "explanation": "The long-term alteration of temperature and typical weather patterns in a place.", "cultural_note": "Climate change is a major global concern, and countries have set targets to reduce their impact."},
+                {"original_word": "la France peut-elle atteindre", "display_format": "**Can France achieve / Can France reach:** Questions the feasibility of achieving a goal.", "explanation": "", "cultural_note": ""},
+                {"original_word": "ses objectifs de réduction d'émissions ?", "display_format": "**Its emission reduction targets?:** The specific goals set for lowering greenhouse gas output.", "explanation": "These targets are often part of national or international agreements like the Paris Agreement.", "cultural_note": "Meeting these targets requires significant policy changes and investments."}
+            ]
+        },
+        "JO 2024 : à un an de l'événement, Paris est-elle prête ?": {
+            "contextual_title_explanations": [
+                {"original_word": "JO 2024", "display_format": "**2024 Olympics (Jeux Olympiques):** Referring to the Olympic Games scheduled for 2024.", "explanation": "'JO' is the common French abbreviation for 'Jeux Olympiques'.", "cultural_note": "Hosting the Olympics is a major undertaking for any city, involving massive investment and global attention. Paris 2024 is a significant national project for France."},
+                {"original_word": "à un an de l'événement", "display_format": "**One year from the event / With one year to go:** Marking the one-year countdown.", "explanation": "", "cultural_note": ""},
+                {"original_word": "Paris est-elle prête ?", "display_format": "**Is Paris ready?:** Questions the city's state of preparedness.", "explanation": "", "cultural_note": "Media scrutiny of Olympic preparations typically intensifies as the event approaches."}
+            ]
+        }
+    }
+    
+    # Select examples for few-shot prompting
+    example_keys = list(pre_designed_data.keys())
+    selected_examples = []
+    for i in range(min(num_examples, len(example_keys))):
+        key = example_keys[i]
+        data = pre_designed_data[key]
+        example_str = f"EXAMPLE {i+1}:\nOriginal Title: \"{key}\"\nContextual Title Explanations (JSON format):\n{json.dumps(data['contextual_title_explanations'], ensure_ascii=False, indent=2)}\n---\n"
+        selected_examples.append(example_str)
+    return "\n".join(selected_examples)
+
+
+@functools.cache
+def _explanation_prompt_head() -> str:
+    """Static part of the explanation prompt – built once, not per article."""
+    return (
+        f"{_few_shot_examples()}\n\n{_NAME_RULE}\n\n{_NAME_EXAMPLES}\n\n"
+        "Return ONLY a valid JSON array named contextual_title_explanations exactly matching this template:\n"
+        f"{_EXPLANATION_SCHEMA}\n\n"
+        "Requirements: one object per token (word or punctuation), complete coverage.\n"
+    )
+
 @dataclass
 class ProcessedArticle:
     """AI-processed article with enhanced learning content"""
@@ -118,7 +408,7 @@ class CostOptimizedAIProcessor:
             'total_cost_today': 0.0,
             'average_processing_time': 0.0,
             'success_rate': 100.0,
-            'failed_articles': []
+            'failed_articles': deque(maxlen=MAX_FAILED_ARTICLES_LOGGED)
         }
         
         # Request session for connection pooling
@@ -205,94 +495,12 @@ class CostOptimizedAIProcessor:
         summary = article.get('summary') or article.get('original_data', {}).get('summary', '')
         content = article.get('content', '')
         
-        # Use the exact few-shot examples from the proven system
-        few_shot_examples = self._get_few_shot_examples()
-
-        # New examples (1 title pair + 5 summaries, 30-40 words each)
-        simplified_examples = """
-TITLE EXAMPLE
-Original Title: Inflation : les prix alimentaires vont-ils enfin baisser ?
-"simplified_french_title": "Inflation : les prix alimentaires vont-ils enfin baisser ?"  # 57 chars
-"simplified_english_title": "Inflation: Will food prices finally fall?"  # 48 chars
-
-SUMMARY EXAMPLE 1 (FR & EN, 34 / 35 words)
-"french_summary": "La nouvelle loi climat oblige les grandes entreprises à publier chaque année un bilan carbone détaillé. Des ONG saluent un pas majeur, mais avertissent que des contrôles sérieux seront essentiels pour éviter le greenwashing."
-"english_summary": "A new climate law forces large companies to publish an annual, detailed carbon report. NGOs welcome the major step yet warn that strong enforcement is crucial to stop firms from green-washing their public image."
-
-SUMMARY EXAMPLE 2 (32 / 33 words)
-"french_summary": "Après deux semaines de grève, la SNCF accepte une hausse salariale de 4 %. Les syndicats considèrent l'accord comme une première victoire et suspendent le mouvement pour laisser place aux négociations sectorielles."
-"english_summary": "After two weeks of strikes, French Railways agreed to a 4 % pay rise. Unions call the deal an initial victory and pause the stoppage, opening room for detailed talks in each job category."
-
-SUMMARY EXAMPLE 3 (37 / 36 words)
-"french_summary": "Le Parlement européen interdit dès 2035 la vente de voitures diesel et essence neuves. Les constructeurs saluent une visibilité claire, mais s'inquiètent du retard des bornes de recharge dans plusieurs États membres."
-"english_summary": "The European Parliament has banned sales of new petrol and diesel cars from 2035. Carmakers welcome the clear timeline yet worry many member states still lag in building a dense fast-charging network."
-
-SUMMARY EXAMPLE 4 (31 / 32 words)
-"french_summary": "Un séisme de magnitude 6,2 a frappé le sud du Chili sans faire de victime grave. Les autorités rappellent cependant l'importance de renforcer les bâtiments anciens situés dans les zones sismiques."
-"english_summary": "A 6.2-magnitude earthquake shook southern Chile causing no serious casualties. Officials nevertheless stress the urgent need to reinforce older buildings that sit in the country's high-risk seismic corridor."
-
-SUMMARY EXAMPLE 5 (35 / 34 words)
-"french_summary": "La finale de Roland-Garros se jouera finalement sous le toit fermé à cause d'orages annoncés. Les organisateurs assurent que cette décision garantit la sécurité du public tout en préservant la qualité du jeu."
-"english_summary": "The French Open final will be played under the closed roof because thunderstorms are forecast. Organisers say the move protects spectators' safety while ensuring consistent playing conditions for the athletes."
-"""
-
-        # COMPREHENSIVE prompt for all outputs
-        full_prompt = f"""{few_shot_examples}
-{simplified_examples}
-
-Please analyze the following French news article and provide ALL the following outputs:
-
-Original Title: {original_title}
-Original Summary: {summary}
-
-Provide your response as a VALID JSON object with these exact keys:
-
-{{
-  "simplified_french_title": "[Create a simplified French version of the title, removing complex phrases while keeping the meaning]",
-  "simplified_english_title": "[Create a clear English translation of the title]", 
-  "french_summary": "[Create a simple French summary in exactly 20-25 words using basic vocabulary]",
-  "english_summary": "[Create a clear English summary in exactly 20-25 words]",
-  "contextual_title_explanations": [
-    {{
-      "original_word": "[exact word/phrase from title]",
-      "display_format": "**[Word]:** [Brief translation]",
-      "explanation": "[Detailed explanation in English]",
-      "cultural_note": "[Cultural context if relevant: historical significance, political context, French cultural aspects, or current events connection. Empty string if not applicable]",
-      "part_of_speech": "[Part of speech of the word]",
-      "cefr": "[CEFR level of the word]",
-      "example": "[One short sentence, max 10 words, showing the word in context]"
-    }}
-  ]
-}}
-
-CRITICAL REQUIREMENTS:
-- Only return the JSON object, no other text
-- Make simplified titles clear and accessible  
-- Simplified titles must be ≤ 60 characters, keep all key actors/action/place, remove click-bait prefixes and quotes, keep original tense.
-- If the original headline names a speaker or source (text before the first colon or within quotes), retain that attribution in the simplified titles.
-- Preserve important scope words such as "régional", "mondial", etc.
-- YOU MUST provide contextual explanations for EVERY SINGLE WORD AND PHRASE in the title - NO EXCEPTIONS
-- This includes: articles (le, la, une), prepositions (de, à, dans, pour), conjunctions (et, que, ou), pronouns (ce, l', on), basic verbs (est, sait), and ALL other words
-- EVERY word helps language learners understand grammar patterns and build vocabulary
-- When a proper noun consists of multiple capitalised words (e.g., "Donald Trump", "David A. Bell"), treat the entire name as **one** original_word and provide one combined explanation – do NOT split names into separate words
-- Even if a word seems "basic", it must be explained for learners at different proficiency levels
-- Punctuation **also** needs context: include brief usage notes for any punctuation marks appearing in the title (e.g., ":" colon introduces a clause, "," comma separates elements, "?" indicates a question) – double-check that commas, colons, slashes, hyphens, and question marks are not skipped.
-- FULL PUNCTUATION WHITELIST: you must add an entry for **each** occurrence of these characters if they appear in the title → . , ; : ! ? … — - / ( ) « » " ' ’
-- COVERAGE CHECK: If the number of objects in "contextual_title_explanations" is **not exactly equal** to the number of tokens (INCLUDING punctuation) in the original title, you must instead reply with ONLY the single word **ERROR**.
-- For **every** original_word you must add three extra teaching fields inside its JSON object:
-   • "part_of_speech"  (noun, verb, adj., etc.)
-   • "cefr"  (A1, A2, B1, B2, C1, C2)
-   • "example"  (ONE short sentence, max 10 words, showing the word in context)
-- Do NOT skip any words - complete coverage is mandatory
-- Ensure all French text uses proper accents and grammar
-- Hyphenated or slash-separated compounds (e.g., "Seine-Saint-Denis", "top/flop", "13/06") must be treated as **one** original_word – do NOT split on the hyphen or slash.
-- Contractions that use an apostrophe (straight ' or curly ’) such as "L'Iran", "n'est", "l'inauguration" must likewise be **one** original_word.
-- When punctuation appears *inside* such a compound/contraction, do **not** create a separate entry for that punctuation – the context belongs to the full word.
-
-Based on the article above, provide the complete JSON response:
-"""
-        
-        return full_prompt
+        return (
+            f"{_few_shot_examples()}\n{_SIMPLIFIED_EXAMPLES}\n\n"
+            "Please analyze the following French news article and provide ALL the following outputs:\n\n"
+            f"Original Title: {original_title}\n"
+            f"Original Summary: {summary}\n{_FULL_PROMPT_REQUIREMENTS}"
+        )
 
     # ------------------------------------------------------------------
     # NEW: two-step prompting helpers (titles+summaries, explanations)
@@ -304,215 +512,14 @@ Based on the article above, provide the complete JSON response:
         original_title = self._merge_proper_nouns(original_title)
         summary = article.get('summary') or article.get('original_data', {}).get('summary', '')
 
-        # Explicit JSON schema that the model must follow
-        json_schema = (
-            '{\n'
-            '  "simplified_french_title": "",\n'
-            '  "simplified_english_title": "",\n'
-            '  "french_summary": "",\n'
-            '  "english_summary": ""\n'
-            '}'
-        )
-
-        return (
-            "You are Better French assistant. Return ONLY a VALID JSON object exactly matching this schema:\n"
-            f"{json_schema}\n"
-            "DO NOT add any other keys or explanatory text.\n\n"
-            "Key requirements:\n"
-            "  • simplified_french_title – concise French ≤ 60 chars, keep speaker & scope.\n"
-            "  • simplified_english_title – faithful English translation ≤ 60 chars.\n"
-            "  • french_summary – simple French, 30-40 words – count them.\n"
-            "  • english_summary – clear English, 30-40 words – count them.\n"
-            "Rules for titles: preserve actors/places/actions, drop click-bait prefixes, maintain tense.\n\n"
-            f"Original Title: {original_title}\n"
-            f"Original Summary: {summary}"
-        )
+        return f"{_TITLE_PROMPT_HEAD}Original Title: {original_title}\nOriginal Summary: {summary}"
 
     def build_explanation_prompt(self, article: Dict[str, Any]) -> str:
         """Prompt that asks only for contextual_title_explanations covering every token."""
         original_title = article.get('title') or article.get('original_data', {}).get('title', '')
         original_title = self._merge_proper_nouns(original_title)
-        few_shot = self._get_few_shot_examples()
-        json_schema = '[\n  {\n    "original_word": "",\n    "display_format": "",\n    "explanation": "",\n    "cultural_note": "",\n    "part_of_speech": "",\n    "cefr": "",\n    "example": ""\n  }\n]'
-
-        name_rule = (
-            "IMPORTANT : treat a person's full name (all consecutive capitalised words, including hyphens, apostrophes or middle initials) as **one** original_word."
-        )
-
-        name_examples = """
-EX 1 — simple two-word name
-Title: "Donald Trump promet un accord"
-contextual_title_explanations: [ {"original_word": "Donald Trump" , "display_format": "**Donald Trump:** 45e président des États-Unis", "explanation": "American politician and businessman."} ]
-
-EX 2 — hyphenated name
-Title: "Jean-Luc Mélenchon critique le budget"
-contextual_title_explanations: [ {"original_word": "Jean-Luc Mélenchon", "display_format": "**Jean-Luc Mélenchon:** Chef du parti LFI", "explanation": "French left-wing political leader."} ]
-
-EX 3 — accented first name
-Title: "Nicolás Maduro annonce des réformes"
-contextual_title_explanations: [ {"original_word": "Nicolás Maduro", "display_format": "**Nicolás Maduro:** Président du Venezuela", "explanation": "Venezuelan head of state."} ]
-
-EX 4 — apostrophe contraction (capital)
-Title: "L'Iran répond aux sanctions"
-contextual_title_explanations: [ {"original_word": "L'Iran", "display_format": "**L'Iran:** Pays du Moyen-Orient", "explanation": "Middle-Eastern country."} ]
-
-EX 5 — apostrophe contraction (lower-case)
-Title: "d'Europe vient une nouvelle directive"
-contextual_title_explanations: [ {"original_word": "d'Europe", "display_format": "**d'Europe:** De l'Europe", "explanation": "Refers to Europe as origin."} ]
-
-EX 6 — place name with accent + hyphen
-Title: "Sécheresse en Île-de-France cet été"
-contextual_title_explanations: [ {"original_word": "Île-de-France", "display_format": "**Île-de-France:** Région de Paris", "explanation": "Region surrounding Paris."} ]
-
-EX 7 — multi-word proper noun with digits
-Title: "Les Jeux Olympiques 2024 approchent"
-contextual_title_explanations: [ {"original_word": "Jeux Olympiques 2024", "display_format": "**Jeux Olympiques 2024:** Événement sportif mondial", "explanation": "2024 Summer Olympic Games."} ]
-
-EX 8 — punctuation token example
-Title: "« Liberté » : un mot chargé d'histoire"
-contextual_title_explanations: [ {"original_word": "«", "display_format": "**«:** Guillemets ouvrants", "explanation": "Opening French quotation mark."}, {"original_word": "Liberté", "display_format": "**Liberté:** Freedom", "explanation": "Abstract noun meaning freedom."}, {"original_word": "»", "display_format": "**»:** Guillemets fermants", "explanation": "Closing French quotation mark."}, {"original_word": ":", "display_format": "**:** Deux-points", "explanation": "Colon introducing an explanation."} ]
-"""
-
-        return (
-            f"{few_shot}\n\n{name_rule}\n\n{name_examples}\n\n"
-            "Return ONLY a valid JSON array named contextual_title_explanations exactly matching this template:\n"
-            f"{json_schema}\n\n"
-            "Requirements: one object per token (word or punctuation), complete coverage.\n"
-            f"Title: {original_title}"
-        )
+        return f"{_explanation_prompt_head()}Title: {original_title}"
 
-    def _get_few_shot_examples(self, num_examples=2):
-        """Get comprehensive few-shot examples from the proven original system"""
-        # COMPLETE pre_designed_data from the original proven system
-        pre_designed_data = {
-            "Droits de douane : ces options sur la table de Donald Trump après son revers judiciaire": {
-                "contextual_title_explanations": {
-                    "Droits de douane": {"display_format": "**Customs Duties / Tariffs:** Taxes on imported goods.", "explanation": "Taxes imposed on goods when they are transported across international borders. Governments usually impose customs duties to protect domestic industries, generate revenue, or regulate the flow of goods.", "cultural_note": "Trade tariffs are a significant tool in international economic policy and can become major points of contention between countries, as seen in various trade disputes involving the US, China, and the EU.", "proficiency_level": "B2"},
-                    "ces": {"display_format": "**These:** (demonstrative adjective)", "explanation": "Used to point out specific items or options being discussed.", "cultural_note": "", "proficiency_level": "A1"},
-                    "options": {"display_format": "**Options:** Choices or alternatives.", "explanation": "Different courses of action that can be chosen.", "cultural_note": "", "proficiency_level": "A2"},
-                    "sur la table": {"display_format": "**On the table:** Under consideration; being discussed or negotiated.", "explanation": "An idiomatic expression meaning that something is available for discussion or is a possibility.", "cultural_note": "Similar to the English idiom 'on the table.'", "proficiency_level": "B1"},
-                    "de": {"display_format": "**Of / From:** (preposition)", "explanation": "Indicates possession, origin, or relationship.", "cultural_note": "", "proficiency_level": "A1"},
-                    "Donald Trump": {"display_format": "**Donald Trump:** 45th President of the United States.", "explanation": "A prominent American political figure and businessman.", "cultural_note": "His presidency was marked by significant changes to US trade policy, including the imposition of tariffs on goods from various countries.", "proficiency_level": "C1"},
-                    "après": {"display_format": "**After:** (preposition)", "explanation": "Indicates something that follows in time.", "cultural_note": "", "proficiency_level": "A1"},
-                    "son": {"display_format": "**His / Her / Its:** (possessive adjective)", "explanation": "Indicates possession.", "cultural_note": "", "proficiency_level": "A1"},
-                    "revers judiciaire": {"display_format": "**Legal setback / Judicial defeat:** A loss or unfavorable outcome in a court case.", "explanation": "Refers to a situation where a legal case or argument has not been successful.", "cultural_note": "Such setbacks can force a re-evaluation of strategy, as discussed in the article regarding Trump's tariff policies.", "proficiency_level": "B2"}
-                }
-            },
-            "EXCLUSIF. Des cadres des Verts plaident pour adhérer à BDS, mouvement controversé de boycott d'Israël": {
-                "contextual_title_explanations": [
-                    {"original_word": "EXCLUSIF", "display_format": "**EXCLUSIVE:** (adjective/noun)", "explanation": "Indicates that the information is being reported for the first time by this news outlet.", "cultural_note": "Commonly used in headlines to attract attention."},
-                    {"original_word": "Des cadres", "display_format": "**Executives / Leading members / Cadres:** Senior or influential members of an organization.", "explanation": "'Cadre' refers to a manager, executive, or a key member of a political party or organization.", "cultural_note": "In French politics, 'cadres' are the backbone of a party's leadership and decision-making structure."},
-                    {"original_word": "des Verts", "display_format": "**Of the Greens (French Green Party):** Refers to the French political party focused on environmental issues (Europe Écologie Les Verts - EELV).", "explanation": "'Les Verts' is the common name for the French Green Party.", "cultural_note": "Like Green parties in other countries, they advocate for ecological policies and often align with left-leaning social stances."},
-                    {"original_word": "plaident pour", "display_format": "**Advocate for / Argue in favor of:** To publicly support or recommend a particular cause or policy.", "explanation": "'Plaider' means to plead or argue a case.", "cultural_note": ""},
-                    {"original_word": "adhérer à", "display_format": "**To join / To adhere to:** To become a member of or to formally agree to support.", "explanation": "'Adhérer' means to stick to, or in a political context, to join or subscribe to a movement or party.", "cultural_note": ""},
-                    {"original_word": "BDS", "display_format": "**BDS (Boycott, Divestment, Sanctions):** A Palestinian-led movement promoting boycotts, divestments, and economic sanctions against Israel.", "explanation": "The movement aims to pressure Israel to meet what it describes as Israel's obligations under international law.", "cultural_note": "BDS is a highly controversial movement, with strong opinions both for and against its methods and goals. Its potential adoption by political parties often sparks significant debate."},
-                    {"original_word": "mouvement", "display_format": "**Movement:** A group of people working together to advance their shared political, social, or artistic ideas.", "explanation": "Refers to an organized effort or campaign.", "cultural_note": ""},
-                    {"original_word": "controversé", "display_format": "**Controversial:** Giving rise or likely to give rise to public disagreement.", "explanation": "Indicates that the subject is a matter of dispute or strong opinions.", "cultural_note": ""},
-                    {"original_word": "de boycott", "display_format": "**Of boycott:** Relating to the act of boycotting.", "explanation": "A boycott is a collective refusal to deal with a person, organization, or country as an expression of protest.", "cultural_note": ""},
-                    {"original_word": "d'Israël", "display_format": "**Of Israel:** Relating to the state of Israel.", "explanation": "Referring to the country in the Middle East.", "cultural_note": ""}
-                ]
-            },
-            "Présidentielle en Pologne : l'élection qui donne des sueurs froides à Bruxelles": {
-                "contextual_title_explanations": [
-                    {"original_word": "Présidentielle", "display_format": "**Presidential (election):** Relating to the election of a president.", "explanation": "Refers to the process of electing a head of state in a republic.", "cultural_note": ""},
-                    {"original_word": "en Pologne", "display_format": "**In Poland:** Referring to the country of Poland.", "explanation": "A country in Central Europe.", "cultural_note": "Poland's political direction has significant implications for the European Union, given its size and strategic location."},
-                    {"original_word": "l'élection", "display_format": "**The election:** The process of choosing someone for a public office by voting.", "explanation": "A formal and organized choice by vote of a person for a political office or other position.", "cultural_note": ""},
-                    {"original_word": "qui donne des sueurs froides", "display_format": "**Which is causing cold sweats / Causing great anxiety:** An idiomatic expression.", "explanation": "Literally 'gives cold sweats,' it means something that causes extreme worry, fear, or anxiety.", "cultural_note": "A common French idiom to express strong apprehension."},
-                    {"original_word": "à Bruxelles", "display_format": "**To Brussels (referring to the EU):** Brussels is the de facto capital of the European Union.", "explanation": "When French media mentions 'Bruxelles' in a political context, it often refers to the institutions and decision-making bodies of the European Union.", "cultural_note": "Similar to how 'Washington' is often used to refer to the US federal government."}
-                ]
-            },
-            "Droits de douane : ces cinq petites entreprises qui ont mis un frein à la machine Trump": {
-                "contextual_title_explanations": [
-                    {"original_word": "Droits de douane", "display_format": "**Customs Duties / Tariffs:** Taxes on imported goods.", "explanation": "Taxes imposed on goods when they are transported across international borders.", "cultural_note": "A recurring theme in trade policy discussions."},
-                    {"original_word": "ces cinq petites entreprises", "display_format": "**These five small businesses:** Referring to specific small companies.", "explanation": "'Petites entreprises' are small to medium-sized enterprises (SMEs), often called PME in French.", "cultural_note": "Small businesses are often portrayed as being particularly vulnerable to broad economic policy shifts like tariffs."},
-                    {"original_word": "qui ont mis un frein à", "display_format": "**That put a brake on / That slowed down:** An idiomatic expression.", "explanation": "Means to slow down or hinder the progress of something.", "cultural_note": "Similar to the English idiom 'put the brakes on.'"},
-                    {"original_word": "la machine Trump", "display_format": "**The Trump machine:** Refers to the administrative and political apparatus of Donald Trump's presidency.", "explanation": "A metaphorical way to describe the functioning and policies of his government.", "cultural_note": "The term 'machine' often implies a powerful, relentless, and somewhat impersonal force."}
-                ]
-            },
-            "Etats-Unis : la Cour d'appel maintient les droits de douane de Donald Trump": {
-                "contextual_title_explanations": [
-                    {"original_word": "Etats-Unis", "display_format": "**United States:** Referring to the United States of America.", "explanation": "Country in North America.", "cultural_note": ""},
-                    {"original_word": "la Cour d'appel", "display_format": "**The Court of Appeal / Appeals Court:** A court that hears appeals from lower court decisions.", "explanation": "A higher court that reviews the decisions of trial courts or other lower courts.", "cultural_note": "An essential part of the judicial process, allowing for review and potential correction of legal errors."},
-                    {"original_word": "maintient", "display_format": "**Maintains / Upholds:** To keep in an existing state; to preserve from failure or decline.", "explanation": "In a legal context, it means to affirm or keep a previous decision or state of affairs in place.", "cultural_note": ""},
-                    {"original_word": "les droits de douane", "display_format": "**The customs duties / The tariffs:** Taxes on imported goods.", "explanation": "Taxes imposed on goods when they are transported across international borders.", "cultural_note": ""},
-                    {"original_word": "de Donald Trump", "display_format": "**Of Donald Trump:** Belonging to or enacted by Donald Trump.", "explanation": "Refers to policies associated with his presidency.", "cultural_note": ""}
-                ]
-            },
-            "Guerre à Gaza : Benyamin Netanyahou, le grand divorce avec les Israéliens": {
-                "contextual_title_explanations": [
-                    {"original_word": "Guerre à Gaza", "display_format": "**War in Gaza:**", "explanation": "Refers to the conflict in the Gaza Strip.", "cultural_note": "Long-standing conflict with global repercussions."},
-                    {"original_word": "Benyamin Netanyahou", "display_format": "**Benjamin Netanyahu:**", "explanation": "Prime Minister of Israel.", "cultural_note": "A polarizing political figure."},
-                    {"original_word": "le grand divorce", "display_format": "**The great divorce:**", "explanation": "Metaphor for a major split or estrangement.", "cultural_note": "Often used to describe political rifts."},
-                    {"original_word": "avec les Israéliens", "display_format": "**With the Israelis:**", "explanation": "Refers to the people of Israel.", "cultural_note": ""}
-                ]
-            },
-            "PS : les députés de Seine-Saint-Denis boycotteront l'inauguration": {
-                "contextual_title_explanations": [
-                    {"original_word": "PS", "display_format": "**PS (Parti socialiste):**", "explanation": "French Socialist Party.", "cultural_note": "A major centre-left political party in France."},
-                    {"original_word": ":", "display_format": "**Colon:**", "explanation": "Introduces an explanation.", "cultural_note": ""},
-                    {"original_word": "les", "display_format": "**The:** (article)", "explanation": "Definite article used before plural nouns.", "cultural_note": ""},
-                    {"original_word": "députés", "display_format": "**Deputies:**", "explanation": "Members of the National Assembly.", "cultural_note": "French parliamentarians."},
-                    {"original_word": "de", "display_format": "**Of / from:**", "explanation": "Preposition indicating origin or possession.", "cultural_note": ""},
-                    {"original_word": "Seine-Saint-Denis", "display_format": "**Seine-Saint-Denis:**", "explanation": "A department north of Paris.", "cultural_note": "Often referenced in socio-economic discussions."},
-                    {"original_word": "boycotteront", "display_format": "**Will boycott:**", "explanation": "Future tense of 'boycotter'.", "cultural_note": ""},
-                    {"original_word": "l'inauguration", "display_format": "**The inauguration:**", "explanation": "Official opening event.", "cultural_note": "Contraction kept as one token as required."}
-                ]
-            },
-            "Face à la Chine, l'Europe en quête d'une nouvelle stratégie industrielle": {
-                "contextual_title_explanations": [
-                    {"original_word": "Face à la Chine", "display_format": "**Facing China / In response to China:** Indicates a reaction or positioning relative to China.", "explanation": "Highlights the challenges or competition posed by China.", "cultural_note": "China's rise as a global economic power is a central theme in international relations and economic policy discussions in Europe."},
-                    {"original_word": "l'Europe", "display_format": "**Europe (often referring to the EU):** The continent, but in policy contexts, usually means the European Union.", "explanation": "The European Union as a political and economic entity.", "cultural_note": ""},
-                    {"original_word": "en quête d'une", "display_format": "**In search of a / Seeking a:** Looking for or trying to find something.", "explanation": "", "cultural_note": ""},
-                    {"original_word": "nouvelle stratégie industrielle", "display_format": "**New industrial strategy:** A revised plan concerning a country's or region's manufacturing and industrial sectors.", "explanation": "Refers to policies aimed at promoting industrial growth, innovation, and competitiveness.", "cultural_note": "Industrial strategy is a key area of EU policy as it seeks to maintain its economic standing."}
-                ]
-            },
-            "IA générative : pourquoi la France est en train de perdre la bataille face aux Etats-Unis": {
-                "contextual_title_explanations": [
-                    {"original_word": "IA générative", "display_format": "**Generative AI:** Artificial Intelligence that can create new content.", "explanation": "A subset of AI that can generate text, images, audio, and other media in response to prompts.", "cultural_note": "A rapidly advancing field with significant economic and societal implications, dominated by major US tech companies but with active research and development globally."},
-                    {"original_word": "pourquoi la France est en train de perdre la bataille", "display_format": "**Why France is losing the battle:** Explores the reasons behind France's perceived disadvantage.", "explanation": "Suggests a competitive struggle where France is not succeeding.", "cultural_note": "There's often a public debate in France about its technological competitiveness, particularly vis-à-vis the US and China."},
-                    {"original_word": "face aux Etats-Unis", "display_format": "**Against the United States / Compared to the United States:** Highlighting the US as the primary competitor or benchmark.", "explanation": "", "cultural_note": ""}
-                ]
-            },
-            "Réforme des retraites : le gouvernement face au mur de la dette": {
-                "contextual_title_explanations": [
-                    {"original_word": "Réforme des retraites", "display_format": "**Pension Reform:** Changes to the national retirement system.", "explanation": "Refers to government policies aimed at modifying how pensions are funded, calculated, and when people can retire.", "cultural_note": "Pension reform is a highly sensitive and frequently debated political issue in France, often leading to widespread protests and strikes."},
-                    {"original_word": "le gouvernement", "display_format": "**The government:** The ruling administration.", "explanation": "The executive branch of the French state.", "cultural_note": ""},
-                    {"original_word": "face au mur de la dette", "display_format": "**Facing the debt wall:** Confronting a significant and challenging level of national debt.", "explanation": "The 'wall' metaphor emphasizes the difficulty and scale of the problem.", "cultural_note": "France, like many developed countries, has a substantial national debt, and its management is a constant concern for policymakers."}
-                ]
-            },
-            "Inflation : les prix alimentaires vont-ils enfin baisser ?": {
-                "contextual_title_explanations": [
-                    {"original_word": "Inflation", "display_format": "**Inflation:** The rate at which the general level of prices for goods and services is rising.", "explanation": "A key economic indicator reflecting the erosion of purchasing power.", "cultural_note": "High inflation, especially for essential goods like food, is a major concern for the public and policymakers."},
-                    {"original_word": "les prix alimentaires", "display_format": "**Food prices:** The cost of food items.", "explanation": "", "cultural_note": ""},
-                    {"original_word": "vont-ils enfin baisser ?", "display_format": "**Will they finally decrease? / Are they finally going to go down?:** Expresses a sense of anticipation or hope for a reduction.", "explanation": "The word 'enfin' (finally) suggests a period of waiting or suffering high prices.", "cultural_note": ""}
-                ]
-            },
-            "Climat : la France peut-elle atteindre ses objectifs de réduction d'émissions ?": {
-                "contextual_title_explanations": [
-                    {"original_word": "Climat", "display_format": "**Climate:** Referring to climate change.", "explanation": "The long-term alteration of temperature and typical weather patterns in a place.", "cultural_note": "Climate change is a major global concern, and countries have set targets to reduce their impact."},
-                    {"original_word": "la France peut-elle atteindre", "display_format": "**Can France achieve / Can France reach:** Questions the feasibility of achieving a goal.", "explanation": "", "cultural_note": ""},
-                    {"original_word": "ses objectifs de réduction d'émissions ?", "display_format": "**Its emission reduction targets?:** The specific goals set for lowering greenhouse gas output.", "explanation": "These targets are often part of national or international agreements like the Paris Agreement.", "cultural_note": "Meeting these targets requires significant policy changes and investments."}
-                ]
-            },
-            "JO 2024 : à un an de l'événement, Paris est-elle prête ?": {
-                "contextual_title_explanations": [
-                    {"original_word": "JO 2024", "display_format": "**2024 Olympics (Jeux Olympiques):** Referring to the Olympic Games scheduled for 2024.", "explanation": "'JO' is the common French abbreviation for 'Jeux Olympiques'.", "cultural_note": "Hosting the Olympics is a major undertaking for any city, involving massive investment and global attention. Paris 2024 is a significant national project for France."},
-                    {"original_word": "à un an de l'événement", "display_format": "**One year from the event / With one year to go:** Marking the one-year countdown.", "explanation": "", "cultural_note": ""},
-                    {"original_word": "Paris est-elle prête ?", "display_format": "**Is Paris ready?:** Questions the city's state of preparedness.", "explanation": "", "cultural_note": "Media scrutiny of Olympic preparations typically intensifies as the event approaches."}
-                ]
-            }
-        }
-        
-        # Select examples for few-shot prompting
-        example_keys = list(pre_designed_data.keys())
-        selected_examples = []
-        for i in range(min(num_examples, len(example_keys))):
-            key = example_keys[i]
-            data = pre_designed_data[key]
-            example_str = f"EXAMPLE {i+1}:\nOriginal Title: \"{key}\"\nContextual Title Explanations (JSON format):\n{json.dumps(data['contextual_title_explanations'], ensure_ascii=False, indent=2)}\n---\n"
-            selected_examples.append(example_str)
-        return "\n".join(selected_examples)
-    
     def call_openrouter_api(self, prompt: str, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Call OpenRouter API with the exact approach from original system"""
         try:
@@ -537,7 +544,7 @@ contextual_title_explanations: [ {"original_word": "«", "display_format": "**«
             response = self.session.post(
                 f"{self.api_base_url}/chat/completions",
                 json=payload,
-                timeout=30
+                timeout=LLM_REQUEST_TIMEOUT
             )
             
             # ------------------------------------------------------------------
@@ -1027,7 +1034,7 @@ contextual_title_explanations: [ {"original_word": "«", "display_format": "**«
                 "ai_processor_version": "Cost-Optimized AI Processor 1.0",
                 "automation_system": "Better French Max Automated System",
                 "model_used": self.model,
-                "processing_statistics": self.processing_stats,
+                "processing_statistics": self._stats_snapshot(),
                 "cost_efficiency": {
                     "daily_cost": self.daily_cost,
                     "cost_per_article": self.daily_cost / len(processed_articles) if processed_articles else 0,
@@ -1048,12 +1055,16 @@ contextual_title_explanations: [ {"original_word": "«", "display_format": "**«
         logger.info(f"💾 AI processed articles saved: {filename}")
         return filename
     
+    def _stats_snapshot(self) -> Dict[str, Any]:
+        """Return processing stats with the failure ring buffer as a JSON-ready list"""
+        return {**self.processing_stats, 'failed_articles': list(self.processing_stats['failed_articles'])}
+    
     def get_processing_summary(self) -> Dict[str, Any]:
         """Get processing summary for monitoring"""
         return {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "status": "active" if self.daily_api_calls < self.cost_config['max_ai_calls_per_day'] else "limit_reached",
-            "daily_statistics": self.processing_stats,
+            "daily_statistics": self._stats_snapshot(),
             "cost_tracking": {
                 "daily_cost": self.daily_cost,
                 "daily_budget": self.cost_config['daily_cost_limit'],
@@ -1077,7 +1088,7 @@ contextual_title_explanations: [ {"original_word": "«", "display_format": "**«
             'total_cost_today': 0.0,
             'average_processing_time': 0.0,
             'success_rate': 100.0,
-            'failed_articles': []
+            'failed_articles': deque(maxlen=MAX_FAILED_ARTICLES_LOGGED)
         }
         logger.info("🔄 Daily AI processing counters reset")
 
@@ -33,13 +33,16 @@ def main():
 
     files = list(iter_files(args.days, args.day))
     seen = set()
+    write = sys.stdout.write
     for fp in files:
         data = json.loads(fp.read_text())
         for item in data:
             h = item.get("link") or item.get("original_article_link")
             if h and h not in seen:
                 seen.add(h)
-                sys.stdout.write(json.dumps(item, ensure_ascii=False) + "\n")
+                # two writes into the buffered stream instead of concatenating a copy
+                write(json.dumps(item, ensure_ascii=False))
+                write("\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -19,10 +19,6 @@ import config.api_config  # noqa: F401 side-effect
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
-# Lazy-import to avoid any circular issues
-fetch_mod = importlib.import_module("ai_engine_v3.scripts.fetch_news")
-qualify_mod = importlib.import_module("ai_engine_v3.scripts.qualify_news")
-
 ROOT = pathlib.Path(__file__).resolve().parent.parent / "ai_engine_v3" / "website"
 
 
@@ -68,8 +64,9 @@ def main():
     # Remove extra CLI args so sub-scripts don't choke on unknown flags
     sys.argv = [sys.argv[0]]
 
-    fetch_mod.main()
-    qualify_mod.main()
+    # Imported only once the key works – qualify_news pulls in spaCy (several seconds)
+    for name in ("ai_engine_v3.scripts.fetch_news", "ai_engine_v3.scripts.qualify_news"):
+        importlib.import_module(name).main()
 
     if args.serve:
         serve_ui()
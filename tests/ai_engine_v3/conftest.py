@@ -0,0 +1,53 @@
+import io
+
+import pytest
+
+from ai_engine_v3.pipeline.scraper import NewsArticle
+
+
+@pytest.fixture
+def make_article():
+    """Factory for minimal scraper NewsArticle objects."""
+    def make(title: str, summary: str = "") -> NewsArticle:
+        return NewsArticle(
+            title=title,
+            summary=summary,
+            link=f"https://example.com/{abs(hash(title))}",
+            published="2025-06-20",
+            published_parsed=None,
+            source_name="Le Monde",
+            source_url="example.com",
+            feed_url="https://example.com/rss",
+            author=None,
+            category=None,
+            tags=[],
+            content=None,
+            image_url=None,
+            image_title=None,
+            guid=None,
+            language="fr",
+            scraped_at="2025-06-20T10:00:00+00:00",
+            article_hash="h",
+            content_hash="c",
+        )
+    return make
+
+
+@pytest.fixture
+def scraper_serving():
+    """Factory for a SmartScraper whose session answers every GET with *body*."""
+    from requests import Response
+    from ai_engine_v3.pipeline.scraper import SmartScraper
+
+    def make(body: bytes):
+        scraper = SmartScraper()
+
+        def fake_get(url, **kwargs):
+            response = Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(body)
+            return response
+
+        scraper.session.get = fake_get
+        return scraper
+    return make
@@ -0,0 +1,40 @@
+import requests
+
+from ai_engine_v3 import client as client_mod
+
+
+def _response(status: int, body: bytes = b"", headers=None) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    r._content = body
+    r.headers.update(headers or {})
+    return r
+
+
+def test_429_pauses_shared_gate_then_retries(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    monkeypatch.setattr(client_mod, "_paused_until", 0.0)
+    replies = [
+        _response(429, headers={"Retry-After": "0"}),
+        _response(200, b'{"choices":[{"message":{"content":" 7 "}}],"usage":{"prompt_tokens":3}}'),
+    ]
+    llm = client_mod.LLMClient(model="m")
+    monkeypatch.setattr(llm.session, "post", lambda *a, **k: replies.pop(0))
+
+    assert llm.chat([{"role": "user", "content": "x"}]) == "7"
+    assert llm.last_usage == {"prompt_tokens": 3}
+    assert client_mod._paused_until > 0
+
+
+def test_clients_share_one_session(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    assert client_mod.LLMClient(model="a").session is client_mod.LLMClient(model="b").session
+
+
+def test_sessions_are_per_api_key(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "first")
+    first = client_mod.LLMClient(model="a").session
+    monkeypatch.setenv("OPENROUTER_API_KEY", "second")
+    second = client_mod.LLMClient(model="a").session
+    assert first is not second
+    assert second.headers["Authorization"] == "Bearer second"
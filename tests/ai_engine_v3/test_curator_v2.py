@@ -0,0 +1,48 @@
+from ai_engine_v3.pipeline.curator_v2 import CuratorV2
+
+
+def test_curate_scores_whole_batch(make_article):
+    arts = [
+        make_article("Grève SNCF ce lundi", "Le trafic sera perturbé sur plusieurs lignes " * 10),
+        make_article("Un chat retrouvé", ""),
+    ]
+    curator = CuratorV2()
+    scored = [curator._score_relevance(a.title + " " + a.summary) for a in arts]
+    assert scored == [9.0, 4.0]
+
+    approved = curator.curate(arts)
+    titles = [a.original_data["title"] for a in approved]
+    assert titles == ["Grève SNCF ce lundi"]
+
+
+def test_relevance_ignores_accents_and_case():
+    curator = CuratorV2()
+    # feed dropped the diacritics; keyword list has "grève" and "SNCF"
+    assert curator._score_relevance("Greve a la sncf") == 9.0
+    assert curator._score_relevance("Les Francais et la meteo") == 7.0
+
+
+def test_relevance_fallback_matches_automaton(monkeypatch):
+    import ai_engine_v3.pipeline.curator_v2 as curator_v2
+    from ai_engine_v3.profile import UserProfile
+
+    profile = UserProfile(user_id="u", interests=["startup"])
+    texts = ["Grève SNCF", "Inflation record", "La France gagne", "Une startup lève 5M", "Un chat"]
+    fast = CuratorV2(profile)
+    monkeypatch.setattr(curator_v2, "ahocorasick", None)
+    slow = CuratorV2(profile)
+    assert slow._automaton is None
+    assert [fast._score_relevance(t) for t in texts] == [slow._score_relevance(t) for t in texts]
+
+
+def test_fold_text_strips_accents_only():
+    from ai_engine_v3.pipeline.utils import fold_text
+
+    assert fold_text("Grève à l'Élysée, cœur") == "greve a l'elysee, cœur"
+
+
+def test_practical_score_counts_each_entity_label_once():
+    from types import SimpleNamespace
+
+    doc = SimpleNamespace(ents=[SimpleNamespace(label_=label) for label in ("MONEY", "MONEY", "ORG", "LOC")])
+    assert CuratorV2()._score_practical(doc) == 4
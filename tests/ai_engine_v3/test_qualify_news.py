@@ -0,0 +1,12 @@
+import logging
+
+
+def test_missing_raw_archive_means_nothing_to_do(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    from ai_engine_v3.scripts import qualify_news
+
+    monkeypatch.setattr(qualify_news, "RAW_DIR", tmp_path / "raw_archive")
+    monkeypatch.setattr(qualify_news, "STATE_FILE", tmp_path / "state.json")
+    with caplog.at_level(logging.INFO, logger=qualify_news.__name__):
+        qualify_news.main()
+    assert "No new delta files to process." in caplog.messages
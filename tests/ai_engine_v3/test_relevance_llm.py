@@ -0,0 +1,44 @@
+def test_parse_score_tolerates_formatting(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    from ai_engine_v3.relevance_llm import _parse_score
+
+    assert [_parse_score(r) for r in ("7", " 7.5\n", "8/10", "Score: 6,5")] == [7.0, 7.5, 8.0, 6.5]
+    assert _parse_score("N/A") is None
+    assert _parse_score("42") is None
+    assert _parse_score("-3") is None
+
+
+def test_empty_reply_scores_zero_and_is_not_cached(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    from ai_engine_v3 import relevance_llm
+
+    calls = []
+
+    def chat(messages, **kwargs):
+        calls.append(kwargs)
+        return ""
+
+    monkeypatch.setattr(relevance_llm, "_SCORE_CACHE", {})
+    monkeypatch.setattr(relevance_llm._llm, "chat", chat)
+    assert relevance_llm.score("Grève SNCF") == (0.0, 0.0)
+    assert relevance_llm._SCORE_CACHE == {}
+    assert calls[0]["reasoning"] == {"enabled": False}
+
+
+def test_cache_flush_replaces_file_and_corrupt_cache_is_reported(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    import json
+    from ai_engine_v3 import relevance_llm
+
+    path = tmp_path / "relevance_scores.json"
+    path.write_text('{"truncated": [7')
+    monkeypatch.setattr(relevance_llm, "CACHE_PATH", path)
+    monkeypatch.setattr(relevance_llm, "_SCORE_CACHE", None)
+    assert relevance_llm._cache() == {}
+    assert "corrupt" in caplog.text
+
+    relevance_llm._SCORE_CACHE["k"] = [7.0, 1]
+    monkeypatch.setattr(relevance_llm, "_cache_dirty", True)
+    relevance_llm.flush_cache()
+    assert json.loads(path.read_text()) == {"k": [7.0, 1]}
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
@@ -0,0 +1,83 @@
+import dataclasses
+
+import feedparser
+
+from ai_engine_v3.pipeline.rss_fast import parse_rss_stream
+from ai_engine_v3.pipeline.scraper import SmartScraper
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>T</title>
+<item>
+  <title>Grève &amp; SNCF</title><link>https://ex.com/a</link>
+  <description><![CDATA[<p>Le <b>trafic</b> <img src="https://ex.com/x.png"/></p>]]></description>
+  <pubDate>Fri, 20 Jun 2025 10:00:00 +0200</pubDate><dc:creator>Jean</dc:creator>
+  <category>Société</category><category>Transport</category>
+  <media:content url="https://ex.com/i.jpg" medium="image" type="image/jpeg"/>
+  <guid>g1</guid><content:encoded><![CDATA[<p>Full</p>]]></content:encoded>
+</item>
+<item>
+  <title>B</title><link>https://ex.com/b</link><description>x</description>
+  <enclosure url="https://ex.com/e.jpg" type="image/jpeg" length="1"/>
+  <author>a@b.c (Anne)</author>
+</item>
+<item><title>C</title><link>https://ex.com/c</link><media:thumbnail url="https://ex.com/t.jpg"/></item>
+</channel></rss>""".encode("utf-8")
+
+
+def _parse(content: bytes):
+    return parse_rss_stream([content], [])
+
+
+def _fields(article):
+    data = dataclasses.asdict(article)
+    data.pop("scraped_at")
+    return data
+
+
+def test_fast_path_matches_feedparser():
+    scraper = SmartScraper()
+    slow = [scraper.parse_feed_entry(e, "S", "u") for e in feedparser.parse(RSS).entries]
+    fast = [scraper.parse_feed_entry(e, "S", "u") for e in _parse(RSS)]
+    assert [_fields(a) for a in fast] == [_fields(a) for a in slow]
+
+
+def test_non_rss_falls_back():
+    atom = b'<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title></feed>'
+    assert _parse(atom) is None
+    assert _parse(b"<rss><channel><item>") is None
+
+
+def test_entries_are_built_lazily():
+    entries = _parse(RSS)
+    assert next(entries)["title"] == "Grève & SNCF"
+    assert [e["link"] for e in entries] == ["https://ex.com/b", "https://ex.com/c"]
+
+
+def test_stream_matches_whole_document_and_keeps_body():
+    chunks = [RSS[i:i + 100] for i in range(0, len(RSS), 100)]
+    body = []
+    streamed = list(parse_rss_stream(iter(chunks), body))
+    assert streamed == list(_parse(RSS))
+    assert b"".join(body) == RSS
+
+
+def test_stream_fallback_still_collects_body():
+    atom = b'<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title></feed>'
+    body = []
+    assert parse_rss_stream([atom[:20], atom[20:]], body) is None
+    assert b"".join(body) == atom
+
+
+def test_entries_without_title_or_link_are_skipped(scraper_serving):
+    body = (
+        b'<rss version="2.0"><channel>'
+        b"<item><title>Kept</title><link>https://ex.com/k</link></item>"
+        b"<item><title></title><link>https://ex.com/untitled</link></item>"
+        b"<item><title>No link</title></item>"
+        b"</channel></rss>"
+    )
+    scraper = scraper_serving(body)
+    assert [a.title for a in scraper.scrape_single_feed("S", "u", scan_type="breaking")] == ["Kept"]
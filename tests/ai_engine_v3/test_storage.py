@@ -0,0 +1,63 @@
+import json
+
+from ai_engine_v3.models import Article, QualityScores
+from ai_engine_v3.storage import Storage
+
+
+def _article(link: str, title: str = "Grève à Paris") -> Article:
+    return Article(
+        original_article_title=title,
+        original_article_link=link,
+        original_article_published_date="2025-06-20T10:00:00+00:00",
+        source_name="Le Monde",
+        quality_scores=QualityScores(
+            quality_score=8, relevance_score=8, importance_score=8, total_score=24
+        ),
+    )
+
+
+def test_save_roundtrip_keeps_accents(tmp_path):
+    path = tmp_path / "articles.json"
+    Storage._save(path, [_article("https://example.com/a")])
+
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    assert raw["articles"][0]["original_article_title"] == "Grève à Paris"
+    assert "Grève" in path.read_text(encoding="utf-8")  # not \\u-escaped
+    assert [str(a.original_article_link) for a in Storage._load(path)] == ["https://example.com/a"]
+    assert not path.with_suffix(".tmp").exists()
+
+
+def test_save_rolling_keeps_newest_copy_per_link(tmp_path, monkeypatch):
+    import ai_engine_v3.storage as storage
+
+    monkeypatch.setattr(storage, "ROLLING_FILE", tmp_path / "rolling.json")
+    monkeypatch.setattr(storage, "BACKUP_DIR", tmp_path)
+
+    old = _article("https://example.com/a", "Ancien titre")
+    old.processed_at = "2025-06-20T10:00:00+00:00"
+    new = _article("https://example.com/a", "Nouveau titre")
+    new.processed_at = "2025-06-20T11:00:00+00:00"
+    other = _article("https://example.com/b")
+
+    Storage.save_rolling([new, other, old])
+
+    titles = sorted(a.original_article_title for a in Storage.load_rolling())
+    assert titles == ["Grève à Paris", "Nouveau titre"]
+
+
+def test_save_rolling_keeps_only_recent_backups(tmp_path, monkeypatch):
+    import ai_engine_v3.storage as storage
+
+    monkeypatch.setattr(storage, "ROLLING_FILE", tmp_path / "rolling.json")
+    monkeypatch.setattr(storage, "BACKUP_DIR", tmp_path / "backups")
+    monkeypatch.setattr(storage, "BACKUP_KEEP", 2)
+    (tmp_path / "backups").mkdir()
+    for name in ("rolling_20250101_00.json", "rolling_20250101_01.json"):
+        (tmp_path / "backups" / name).write_text("{}")
+
+    Storage.save_rolling([_article("https://example.com/a")])  # first save: nothing to back up
+    Storage.save_rolling([_article("https://example.com/b")])
+
+    backups = sorted(p.name for p in (tmp_path / "backups").iterdir())
+    assert len(backups) == 2
+    assert backups[0] == "rolling_20250101_01.json"
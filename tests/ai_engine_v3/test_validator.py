@@ -11,4 +11,11 @@ def test_validate_titles_success():
 def test_validate_explanations_success():
     raw = '[{"original_word": "mot", "display_format": "**Word:** mot", "explanation": "A basic unit of language", "cultural_note": "Commonly used example word in French textbooks."}]'
     ok, data, _ = validate_explanations_payload(raw)
-    assert ok is True and isinstance(data, list) 
\ No newline at end of file
+    assert ok is True and isinstance(data, list) 
+
+def test_expected_tokens_from_title():
+    from ai_engine_v3.validator import expected_tokens_from_title
+
+    assert expected_tokens_from_title("L'Union et Jean-Luc Mélenchon: « grève » !") == {
+        "L'Union", "et", "Jean", "Luc", "Mélenchon", ":", "«", "grève", "»", "!",
+    }